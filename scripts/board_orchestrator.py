@@ -17,8 +17,13 @@ Env:
 from __future__ import annotations
 
 import base64
+import collections
+import concurrent.futures
 import errno
+import functools
 import hashlib
+import http.client
+import itertools
 import json
 import os
 import re
@@ -26,25 +31,36 @@ import secrets
 import shlex
 import shutil
 import subprocess
+import sys
+import threading
 import time
+import urllib.parse
 import urllib.request
-import urllib.error
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     import fcntl
 except Exception:  # pragma: no cover - platform dependent
     fcntl = None
 
+try:
+    import orjson  # optional: faster JSON encoding for the cron payload + state file
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 STATE_PATH = (
     os.environ.get("BOARD_ORCHESTRATOR_STATE")
     or os.environ.get("RECALLDECK_STATE_PATH")
     or os.environ.get("STATE_PATH")
     or "/Users/joshwegener/clawd/memory/board-orchestrator-state.json"
 )
+# Human-readable (indented, key-sorted) state file; the default compact form is ~2x smaller.
+PRETTY_STATE = os.environ.get("BOARD_ORCHESTRATOR_PRETTY_STATE", "0").strip().lower() in ("1", "true", "yes", "on")
 LOCK_PATH = os.environ.get("BOARD_ORCHESTRATOR_LOCK", "/tmp/board-orchestrator.lock")
 LOCK_STRATEGY = os.environ.get("BOARD_ORCHESTRATOR_LOCK_STRATEGY", "flock").strip().lower()
 LOCK_WAIT_MS = int(os.environ.get("BOARD_ORCHESTRATOR_LOCK_WAIT_MS", "0"))
+# legacy-stale-file only: how often a live run touches the lock so long runs never look stale.
+LOCK_REFRESH_SEC = float(os.environ.get("BOARD_ORCHESTRATOR_LOCK_REFRESH_SEC", "30"))
 
 PROJECT_NAME = os.environ.get("RECALLDECK_PROJECT", "RecallDeck")
 KANBOARD_BASE = os.environ.get("KANBOARD_BASE", "http://localhost:8401/jsonrpc.php")
@@ -114,14 +130,36 @@ CRITICAL_FREEZE_ALL = os.environ.get("BOARD_ORCHESTRATOR_CRITICAL_FREEZE_ALL", "
     "on",
 )
 
-# Accept both "Depends on:" and "Dependencies:" prefixes (we've seen both in task descriptions).
-DEPENDS_RE = re.compile(r"^(?:depends on|dependency|dependencies)\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
-EXCLUSIVE_RE = re.compile(r"^exclusive\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
-REPO_RE = re.compile(r"^repo\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+# Description directives, one per line: "Depends on:" (also "Dependency:"/"Dependencies:" — we've
+# seen all of them in task descriptions), "Exclusive:" and "Repo:". Matched in a single pass.
+DESC_DIRECTIVE_RE = re.compile(
+    r"^(?:"
+    r"(?:depends on|dependency|dependencies)\s*:\s*(?P<depends>.+)"
+    r"|exclusive\s*:\s*(?P<exclusive>.+)"
+    r"|repo\s*:\s*(?P<repo>.+)"
+    r")$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Every directive name contains one of these; descriptions without any skip the regex.
+DESC_DIRECTIVE_WORDS = ("depend", "exclusive", "repo")
+# Dependency lists may be comma- or whitespace-separated ("#12, #13" / "#12 #13").
+DEPENDS_SPLIT_RE = re.compile(r"[\s,]+")
+# Title prefix repo hint, e.g. "Web/Playground: ..." -> "Web/Playground".
+TITLE_REPO_PREFIX_RE = re.compile(r"^\s*([A-Za-z0-9_/-]+)\s*:\s*")
+REPO_KEY_SEP_RE = re.compile(r"[^a-z0-9]+")
+REPO_KEY_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+REVIEW_SCORE_RE = re.compile(r"score\s*[:=]\s*(\d{1,3})", re.IGNORECASE)
+REVIEW_VERDICT_RE = re.compile(r"verdict\s*[:=]\s*([A-Za-z]+)", re.IGNORECASE)
 PATCH_MARKER_RE = re.compile(
     r"(?:patch file|patch to apply|generated patch)\s*:\s*`?([^\s`]+)`?",
     re.IGNORECASE,
 )
+# Bytes twin of PATCH_MARKER_RE so worker log tails can be scanned without decoding them.
+PATCH_MARKER_BYTES_RE = re.compile(
+    rb"(?:patch file|patch to apply|generated patch)\s*:\s*`?([^\s`]+)`?",
+    re.IGNORECASE,
+)
+REVIEW_START_MARKER = b"### REVIEW START"
 REVIEW_RESULT_RE = re.compile(r"review[_ ]result\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
 
 REPO_ROOT = os.environ.get("RECALLDECK_REPO_ROOT", "/Users/joshwegener/Projects/RecallDeck")
@@ -150,6 +188,8 @@ THRASH_WINDOW_MIN = int(os.environ.get("BOARD_ORCHESTRATOR_THRASH_WINDOW_MIN", "
 THRASH_MAX_RESPAWNS = int(os.environ.get("BOARD_ORCHESTRATOR_THRASH_MAX_RESPAWNS", "3"))
 THRASH_PAUSE_TAG = os.environ.get("BOARD_ORCHESTRATOR_THRASH_PAUSE_TAG", "paused:thrash")
 WORKER_RUN_TIMEOUT_MIN = int(os.environ.get("BOARD_ORCHESTRATOR_WORKER_RUN_TIMEOUT_MIN", "180"))
+# Max concurrent worker liveness probes (tmux list-windows / pid checks) per run.
+WORKER_PROBE_CONCURRENCY = int(os.environ.get("BOARD_ORCHESTRATOR_WORKER_PROBE_CONCURRENCY", "8"))
 REVIEW_RUN_TIMEOUT_MIN = int(os.environ.get("BOARD_ORCHESTRATOR_REVIEW_RUN_TIMEOUT_MIN", "60"))
 REVIEWER_LOG_DIR = os.environ.get(
     "BOARD_ORCHESTRATOR_REVIEWER_LOG_DIR",
@@ -203,6 +243,11 @@ COL_DONE = "Done"
 NOTIFY_CMD = os.environ.get("BOARD_ORCHESTRATOR_NOTIFY_CMD", "").strip()
 NOTIFY_DEDUP_SECONDS = int(os.environ.get("BOARD_ORCHESTRATOR_NOTIFY_DEDUP_SECONDS", "60"))
 DEBUG_RPC = os.environ.get("BOARD_ORCHESTRATOR_DEBUG_RPC", "0").strip().lower() in ("1", "true", "yes", "on")
+# Report Ready cards left in place (cooldown / exclusive conflict) as actions. Turn off to keep
+# quiet ticks silent for cron; applied moves and errors are always reported.
+REPORT_SKIPS = os.environ.get("BOARD_ORCHESTRATOR_REPORT_SKIPS", "1").strip().lower() not in ("0", "false", "no", "off")
+# Max calls per JSON-RPC batch request (0/1 disables batching; calls go out one by one).
+RPC_BATCH_MAX = int(os.environ.get("BOARD_ORCHESTRATOR_RPC_BATCH_MAX", "50"))
 
 
 def now_ms() -> int:
@@ -243,6 +288,9 @@ def pick_critical_queue(
 ) -> Tuple[Optional[Tuple[Dict[str, Any], int, int]], List[Tuple[Dict[str, Any], int, int]]]:
     if not critical_candidates:
         return None, []
+    if len(critical_candidates) == 1:
+        return critical_candidates[0], []
+    # sorted() evaluates the key once per candidate; the full order is needed for the queue.
     critical_sorted = sorted(
         critical_candidates,
         key=lambda item: critical_sort_key(item[2], col_wip_id, col_review_id, col_ready_id, sort_key_fn(item)),
@@ -255,25 +303,19 @@ def plan_pause_wip(
     critical_task_ids: set[int],
     paused_by_critical: Dict[str, Any],
 ) -> List[int]:
-    pause_ids: List[int] = []
-    for tid in wip_task_ids:
-        if tid in critical_task_ids:
-            continue
-        if str(tid) in paused_by_critical:
-            continue
-        pause_ids.append(tid)
-    return pause_ids
+    # Skip malformed (non-numeric) state keys rather than abort the tick on a hand-edited state file.
+    already_paused = {int(k) for k in paused_by_critical if str(k).isdigit()}
+    return [tid for tid in wip_task_ids if tid not in critical_task_ids and tid not in already_paused]
 
 
 def sorted_paused_ids(paused_by_critical: Dict[str, Any]) -> List[int]:
-    paused_ids = [int(k) for k in paused_by_critical.keys()]
-    return sorted(
-        paused_ids,
-        key=lambda tid: (
-            int(paused_by_critical.get(str(tid), {}).get("pausedAtMs", 0) or 0),
-            tid,
-        ),
+    # State keys stay strings (JSON); convert each once while building the (pausedAtMs, id) sort key.
+    order = sorted(
+        (int(info.get("pausedAtMs", 0) or 0) if isinstance(info, dict) else 0, int(k))
+        for k, info in paused_by_critical.items()
+        if str(k).isdigit()
     )
+    return [tid for _paused_at, tid in order]
 
 
 def plan_resume_from_state(
@@ -300,7 +342,7 @@ def plan_resume_from_state(
 def load_state() -> Dict[str, Any]:
     if os.path.exists(STATE_PATH):
         try:
-            with open(STATE_PATH, "r") as f:
+            with open(STATE_PATH, "r", encoding="utf-8") as f:
                 return json.load(f)
         except Exception:
             pass
@@ -330,8 +372,41 @@ def load_state() -> Dict[str, Any]:
 
 def save_state(state: Dict[str, Any]) -> None:
     os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
-    with open(STATE_PATH, "w") as f:
-        json.dump(state, f, indent=2, sort_keys=True)
+    if orjson is not None:
+        opts = orjson.OPT_NON_STR_KEYS
+        if PRETTY_STATE:
+            opts |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        blob = orjson.dumps(state, option=opts)
+    elif PRETTY_STATE:
+        blob = json.dumps(state, indent=2, sort_keys=True).encode("utf-8")
+    else:
+        blob = json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+    # Most cron ticks change nothing; skip the rewrite when the file already holds these bytes.
+    try:
+        if os.path.getsize(STATE_PATH) == len(blob):
+            with open(STATE_PATH, "rb") as f:
+                if f.read() == blob:
+                    return
+    except OSError:
+        pass
+
+    # Write a sibling temp file and rename it over the state so a crash mid-write can't leave a
+    # truncated file (load_state would silently fall back to defaults and drop bookkeeping).
+    tmp = f"{STATE_PATH}.tmp.{os.getpid()}"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(blob)
+            # Make the bytes durable before the rename, or a power loss can leave an empty file.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, STATE_PATH)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
 
 def _notify_digest(message: str) -> str:
@@ -807,16 +882,34 @@ def tmux_kill_window(window_name: str) -> None:
         pass
 
 
+def start_lock_heartbeat(path: str) -> threading.Event:
+    """Touch `path` every LOCK_REFRESH_SEC until the returned event is set."""
+    stop = threading.Event()
+
+    def beat() -> None:
+        while not stop.wait(LOCK_REFRESH_SEC):
+            try:
+                os.utime(path, None)
+            except Exception:
+                pass
+
+    threading.Thread(target=beat, name="board-orchestrator-lock-heartbeat", daemon=True).start()
+    return stop
+
+
 def acquire_lock_legacy(run_id: str) -> Optional[Dict[str, Any]]:
-    # stale after 10 minutes
-    stale_ms = 10 * 60 * 1000
+    # stale after 10 minutes without a heartbeat (or 5 missed heartbeats, if that is longer)
+    stale_ms = max(10 * 60 * 1000, int(LOCK_REFRESH_SEC * 5 * 1000))
     deadline_ms = now_ms() + max(0, LOCK_WAIT_MS)
     while True:
         if os.path.exists(LOCK_PATH):
             try:
                 with open(LOCK_PATH, "r") as f:
                     lock = json.load(f)
-                if now_ms() - int(lock.get("createdAtMs", 0)) < stale_ms:
+                # The holder refreshes the mtime while it runs; createdAtMs alone would expire
+                # a run that is simply slow.
+                last_ms = max(int(lock.get("createdAtMs", 0)), int(os.path.getmtime(LOCK_PATH) * 1000))
+                if now_ms() - last_ms < stale_ms:
                     if LOCK_WAIT_MS <= 0 or now_ms() >= deadline_ms:
                         return None
                     time.sleep(0.05)
@@ -828,7 +921,7 @@ def acquire_lock_legacy(run_id: str) -> Optional[Dict[str, Any]]:
             fh = open(LOCK_PATH, "w")
             json.dump({"pid": os.getpid(), "createdAtMs": now_ms(), "runId": run_id}, fh)
             fh.flush()
-            return {"fh": fh, "strategy": "legacy-stale-file"}
+            return {"fh": fh, "strategy": "legacy-stale-file", "heartbeat": start_lock_heartbeat(LOCK_PATH)}
         except Exception:
             return None
 
@@ -880,6 +973,9 @@ def release_lock(lock: Optional[Dict[str, Any]]) -> None:
         return
     strategy = lock.get("strategy")
     fh = lock.get("fh")
+    heartbeat = lock.get("heartbeat")
+    if heartbeat is not None:
+        heartbeat.set()
     try:
         if fh:
             fh.close()
@@ -893,10 +989,127 @@ def release_lock(lock: Optional[Dict[str, Any]]) -> None:
             pass
 
 
-def rpc(method: str, params: Any = None) -> Any:
+# One keep-alive connection to Kanboard per process (runs are serialized by the lock, so no pooling).
+_rpc_conn: Optional[http.client.HTTPConnection] = None
+_rpc_conn_key: Optional[Tuple[str, str]] = None
+# Request target and Proxy-Authorization for the open connection (set when it is opened).
+_rpc_conn_path: str = "/"
+_rpc_proxy_headers: Dict[str, str] = {}
+
+
+def _rpc_proxy_for(url: urllib.parse.SplitResult) -> Optional[urllib.parse.SplitResult]:
+    """The HTTP(S)_PROXY to use for `url` (honoring NO_PROXY), as urllib.urlopen would pick it."""
+    proxy = urllib.request.getproxies().get(url.scheme)
+    if not proxy or urllib.request.proxy_bypass(url.hostname or ""):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    parsed = urllib.parse.urlsplit(proxy)
+    return parsed if parsed.hostname else None
+
+
+def _rpc_connection() -> Tuple[http.client.HTTPConnection, str, bool]:
+    """Return (connection, request_path, reused) for KANBOARD_BASE, opening it if needed."""
+    global _rpc_conn, _rpc_conn_key, _rpc_conn_path, _rpc_proxy_headers
+    url = urllib.parse.urlsplit(KANBOARD_BASE)
+    key = (url.scheme, url.netloc)
+    if _rpc_conn is not None and _rpc_conn_key == key:
+        return _rpc_conn, _rpc_conn_path, True
+    close_rpc_connection()
+
+    path = (url.path or "/") + (f"?{url.query}" if url.query else "")
+    proxy = _rpc_proxy_for(url)
+    proxy_auth: Dict[str, str] = {}
+    host = url.netloc
+    if proxy is not None:
+        host = f"{proxy.hostname}:{proxy.port}" if proxy.port else str(proxy.hostname)
+        if proxy.username:
+            creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+            proxy_auth["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+
+    _rpc_proxy_headers = {}
+    if url.scheme == "https":
+        _rpc_conn = http.client.HTTPSConnection(host, timeout=30)
+        if proxy is not None:
+            # HTTPS goes through the proxy as a CONNECT tunnel; TLS is still end-to-end with Kanboard.
+            _rpc_conn.set_tunnel(url.hostname or "", url.port or 443, headers=proxy_auth or None)
+    else:
+        _rpc_conn = http.client.HTTPConnection(host, timeout=30)
+        if proxy is not None:
+            # Plain-HTTP proxies take the absolute URL as the request target.
+            path = urllib.parse.urlunsplit((url.scheme, url.netloc, url.path or "/", url.query, ""))
+            _rpc_proxy_headers = proxy_auth
+    _rpc_conn_key = key
+    _rpc_conn_path = path
+    return _rpc_conn, path, False
+
+
+def close_rpc_connection() -> None:
+    global _rpc_conn, _rpc_conn_key
+    if _rpc_conn is not None:
+        try:
+            _rpc_conn.close()
+        except Exception:
+            pass
+    _rpc_conn = None
+    _rpc_conn_key = None
+
+
+@functools.lru_cache(maxsize=4)
+def _rpc_headers(user: str, token: str) -> Dict[str, str]:
+    # Same credentials for every call in a run; encode the Basic auth header once.
+    auth = base64.b64encode(f"{user}:{token}".encode()).decode()
+    return {"Content-Type": "application/json", "Authorization": f"Basic {auth}"}
+
+
+def _rpc_read_only(payload: Any) -> bool:
+    """True if every call in a JSON-RPC payload (single or batch) is a read (get*)."""
+    items = payload if isinstance(payload, list) else [payload]
+    return all(isinstance(i, dict) and str(i.get("method") or "").startswith("get") for i in items)
+
+
+def _rpc_post(payload: Any, label: str) -> Any:
+    """POST a JSON-RPC payload (single request or batch array) and return the decoded JSON body."""
     if not KANBOARD_USER or not KANBOARD_TOKEN:
         raise RuntimeError("KANBOARD_USER/KANBOARD_TOKEN not set")
 
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+    headers = _rpc_headers(KANBOARD_USER, KANBOARD_TOKEN)
+
+    while True:
+        conn, path, reused = _rpc_connection()
+        try:
+            conn.request("POST", path, body=body, headers={**headers, **_rpc_proxy_headers})
+            resp = conn.getresponse()
+            raw = resp.read().decode(errors="replace")
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # Usually the server dropped an idle keep-alive connection, but the request may already
+            # have been applied. Only reads are retried (once, on a fresh connection); a resent
+            # createTask/moveTaskPosition could apply twice, so writes propagate the error.
+            close_rpc_connection()
+            if reused and _rpc_read_only(payload):
+                continue
+            raise
+        except Exception:
+            close_rpc_connection()
+            raise
+        break
+
+    if resp.will_close:
+        close_rpc_connection()
+
+    if resp.status >= 400:
+        snippet = raw[:200].replace("\n", "\\n") if raw else ""
+        raise RuntimeError(f"Kanboard HTTP {resp.status} for {label}: {resp.reason}; body={snippet!r}")
+
+    # Kanboard can emit PHP fatals as HTML; guard
+    try:
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        raise RuntimeError(f"Non-JSON response from Kanboard: {raw[:200]}")
+
+
+def rpc(method: str, params: Any = None) -> Any:
     if DEBUG_RPC:
         if method in ("moveTaskPosition", "setTaskTags"):
             print(f"[rpc] {method} params={params!r}", flush=True)
@@ -907,35 +1120,68 @@ def rpc(method: str, params: Any = None) -> Any:
     if params is not None:
         payload["params"] = params
 
-    auth = base64.b64encode(f"{KANBOARD_USER}:{KANBOARD_TOKEN}".encode()).decode()
-    req = urllib.request.Request(
-        KANBOARD_BASE,
-        data=json.dumps(payload).encode(),
-        headers={"Content-Type": "application/json", "Authorization": f"Basic {auth}"},
-    )
+    out = _rpc_post(payload, method)
+    if out.get("error"):
+        raise RuntimeError(str(out["error"]))
 
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode()
-    except urllib.error.HTTPError as e:
-        body = ""
+    return out.get("result")
+
+
+def rpc_batch(calls: List[Tuple[str, Any]], return_exceptions: bool = False) -> List[Any]:
+    """Run several JSON-RPC calls in as few HTTP requests as possible.
+
+    Returns results in call order and raises on the first call that returned an error (like rpc()).
+    With return_exceptions=True a failed call yields its exception in place instead, so callers can
+    keep the other results. If the batch request itself fails (server/proxy without batch support,
+    non-JSON reply), the calls are retried one by one through rpc().
+    """
+
+    def call_one(method: str, params: Any) -> Any:
+        if not return_exceptions:
+            return rpc(method, params)
         try:
-            body = e.read().decode(errors="replace")
-        except Exception:
-            body = ""
-        snippet = body[:200].replace("\n", "\\n") if body else ""
-        raise RuntimeError(f"Kanboard HTTP {e.code} for {method}: {e.reason}; body={snippet!r}")
+            return rpc(method, params)
+        except Exception as e:
+            return e
 
-    # Kanboard can emit PHP fatals as HTML; guard
-    try:
-        out = json.loads(raw)
-    except Exception:
-        raise RuntimeError(f"Non-JSON response from Kanboard: {raw[:200]}")
+    if not calls:
+        return []
+    if RPC_BATCH_MAX <= 1 or len(calls) == 1:
+        return [call_one(m, p) for m, p in calls]
+
+    results: List[Any] = []
+    for start in range(0, len(calls), RPC_BATCH_MAX):
+        chunk = calls[start : start + RPC_BATCH_MAX]
+        if DEBUG_RPC:
+            print(f"[rpc] batch x{len(chunk)}: {', '.join(sorted(set(m for m, _p in chunk)))}", flush=True)
+        payload: List[Dict[str, Any]] = []
+        for i, (method, params) in enumerate(chunk):
+            item: Dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": i + 1}
+            if params is not None:
+                item["params"] = params
+            payload.append(item)
 
-    if out.get("error"):
-        raise RuntimeError(str(out["error"]))
+        try:
+            out = _rpc_post(payload, f"batch x{len(chunk)}")
+            if not isinstance(out, list):
+                raise RuntimeError("batch response is not a list")
+            by_id = {int(r.get("id")): r for r in out if isinstance(r, dict) and r.get("id") is not None}
+            if len(by_id) != len(chunk):
+                raise RuntimeError("batch response is missing results")
+        except Exception:
+            results.extend(call_one(m, p) for m, p in chunk)
+            continue
 
-    return out.get("result")
+        for i, (method, _params) in enumerate(chunk):
+            r = by_id[i + 1]
+            if r.get("error"):
+                err = RuntimeError(f"{method}: {r['error']}")
+                if not return_exceptions:
+                    raise err
+                results.append(err)
+                continue
+            results.append(r.get("result"))
+    return results
 
 
 def get_project_id() -> int:
@@ -947,37 +1193,151 @@ def get_board(pid: int) -> List[Dict[str, Any]]:
     return rpc("getBoard", {"project_id": pid})
 
 
+# Per-run read-through caches for getTask/getTaskTags. main() resets them at the start of every run;
+# set_task_tags() writes through and move_task() drops the moved task, so reads stay consistent with
+# this run's own mutations.
+_task_cache: Dict[int, Dict[str, Any]] = {}
+_task_tags_cache: Dict[int, List[str]] = {}
+# Tag changes queued by queue_task_tags(): task id -> (tags to add keyed by lowercased name, lowercased
+# tags to remove). flush_task_tags() applies them to freshly read tags, so edits made on the board during
+# the run survive, and sends one setTaskTags per task whose tags actually change.
+_task_tags_pending: Dict[int, Tuple[Dict[str, str], set[str]]] = {}
+
+
+def reset_task_caches() -> None:
+    _task_cache.clear()
+    _task_tags_cache.clear()
+    _task_tags_pending.clear()
+
+
 def get_task(task_id: int) -> Dict[str, Any]:
-    return rpc("getTask", [task_id])
+    tid = int(task_id)
+    cached = _task_cache.get(tid)
+    if cached is None:
+        cached = rpc("getTask", [task_id])
+        if isinstance(cached, dict):
+            _task_cache[tid] = cached
+        else:
+            return cached
+    return dict(cached)
 
 
 def get_task_tags(task_id: int) -> List[str]:
-    # returns dict {tag_id: tag_name}
-    res = rpc("getTaskTags", {"task_id": task_id}) or {}
-    return list(res.values())
+    tid = int(task_id)
+    cached = _task_tags_cache.get(tid)
+    if cached is None:
+        # returns dict {tag_id: tag_name}
+        res = rpc("getTaskTags", {"task_id": task_id}) or {}
+        cached = list(res.values())
+        _task_tags_cache[tid] = cached
+    return list(cached)
+
+
+def prefetch_task_details(task_ids: Iterable[int], tag_ids: Optional[Iterable[int]] = None) -> None:
+    """Warm the task cache for `task_ids` and the tag cache for `tag_ids` (default: the same ids)
+    with one batched request. Already-cached entries are skipped. Best-effort: entries whose call
+    failed are left uncached (the lazy getters fetch them on demand); the rest are still cached."""
+    task_ids = list(task_ids)
+    want_tasks = [tid for tid in dict.fromkeys(int(t) for t in task_ids) if tid not in _task_cache]
+    want_tags = [
+        tid
+        for tid in dict.fromkeys(int(t) for t in (task_ids if tag_ids is None else tag_ids))
+        if tid not in _task_tags_cache
+    ]
+    calls: List[Tuple[str, Any]] = [("getTask", [tid]) for tid in want_tasks]
+    calls += [("getTaskTags", {"task_id": tid}) for tid in want_tags]
+    if not calls:
+        return
+    try:
+        res = rpc_batch(calls, return_exceptions=True)
+    except Exception:
+        return
+    for tid, r in zip(want_tasks, res):
+        if isinstance(r, dict):
+            _task_cache[tid] = r
+    for tid, r in zip(want_tags, res[len(want_tasks):]):
+        if isinstance(r, Exception):
+            continue
+        _task_tags_cache[tid] = list((r or {}).values())
+
+
+def prefetch_task_tags(task_ids: List[int]) -> None:
+    """Warm the tag cache for several tasks with one batched request. Best-effort."""
+    prefetch_task_details([], task_ids)
+
+
+def prefetch_tasks(task_ids: List[int]) -> None:
+    """Warm the task cache for several tasks with one batched request. Best-effort."""
+    prefetch_task_details(task_ids, [])
+
+
+@functools.lru_cache(maxsize=512)
+def parse_description_directives(description: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return the raw (depends_on, exclusive, repo) values from a description.
+
+    First occurrence of each directive wins. Cached because the same description is parsed by
+    dependency, exclusive and repo checks for every candidate.
+    """
+    text = description or ""
+    # Most descriptions carry no directives; a substring probe is much cheaper than the regex scan.
+    lowered = text.lower()
+    if ":" not in text or not any(word in lowered for word in DESC_DIRECTIVE_WORDS):
+        return None, None, None
+    found: Dict[str, str] = {}
+    pos = 0
+    while len(found) < 3:
+        m = DESC_DIRECTIVE_RE.search(text, pos)
+        if not m:
+            break
+        found.setdefault(m.lastgroup or "", m.group(m.lastgroup or 0))
+        # Resume at the next line, not the match end: "\s*" after the colon may have run onto
+        # the following line, which can itself hold another directive.
+        pos = text.find("\n", m.start()) + 1
+        if pos <= 0:
+            break
+    return found.get("depends"), found.get("exclusive"), found.get("repo")
+
+
+@functools.lru_cache(maxsize=512)
+def parse_description_lists(description: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """Parsed (depends-on ids, exclusive keys) from a description, memoized like the raw directives.
+
+    Tuples so cached results can't be mutated by callers.
+    """
+    raw_depends, raw_exclusive, _repo = parse_description_directives(description)
+    ids: List[int] = []
+    if raw_depends is not None:
+        # allow comma- or whitespace-separated lists
+        for part in DEPENDS_SPLIT_RE.split(raw_depends.strip()):
+            part = part.strip()
+            if not part:
+                continue
+            if part.startswith('#'):
+                part = part[1:]
+            if part.isdigit():
+                ids.append(int(part))
+    keys: List[str] = []
+    if raw_exclusive is not None:
+        for part in raw_exclusive.split(','):
+            k = part.strip().lower()
+            if k:
+                keys.append(k)
+    return tuple(ids), tuple(keys)
 
 
 def parse_depends_on(description: str) -> List[int]:
     if not description:
         return []
-    m = DEPENDS_RE.search(description)
-    if not m:
-        return []
-    raw = m.group(1)
-    ids: List[int] = []
-    # allow comma- or whitespace-separated lists
-    for part in re.split(r"[\s,]+", raw.strip()):
-        part = part.strip()
-        if not part:
-            continue
-        if part.startswith('#'):
-            part = part[1:]
-        if part.isdigit():
-            ids.append(int(part))
-    return ids
+    return list(parse_description_lists(description)[0])
 
 
 def parse_exclusive_keys(tags: List[str], description: str) -> List[str]:
+    return list(_exclusive_keys(tuple(tags), description or ""))
+
+
+@functools.lru_cache(maxsize=512)
+def _exclusive_keys(tags: Tuple[str, ...], description: str) -> Tuple[str, ...]:
+    # Memoized: WIP cards' keys are re-derived by the critical, pull and auto-heal checks each run.
     keys: List[str] = []
     for t in tags:
         if ':' in t:
@@ -985,29 +1345,28 @@ def parse_exclusive_keys(tags: List[str], description: str) -> List[str]:
             if a.strip().lower() == 'exclusive' and b.strip():
                 keys.append(b.strip().lower())
     if description:
-        m = EXCLUSIVE_RE.search(description)
-        if m:
-            raw = m.group(1)
-            for part in raw.split(','):
-                k = part.strip().lower()
-                if k:
-                    keys.append(k)
-    # dedupe
-    out: List[str] = []
-    seen = set()
-    for k in keys:
-        if k not in seen:
-            out.append(k)
-            seen.add(k)
-    return out
+        keys.extend(parse_description_lists(description)[1])
+    # dedupe, keeping first-seen order
+    return tuple(dict.fromkeys(keys))
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_repo_key(key: str) -> str:
     k = (key or "").strip().lower()
-    k = re.sub(r"[^a-z0-9]+", "-", k).strip("-")
+    # Fast path: most keys are already slugs, where the substitution would be a no-op.
+    if REPO_KEY_CHARS.issuperset(k) and "--" not in k:
+        return k.strip("-")
+    k = REPO_KEY_SEP_RE.sub("-", k).strip("-")
     return k
 
 
+def path_mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_repo_map_from_file(path: str) -> Dict[str, str]:
     if not path:
         return {}
@@ -1033,21 +1392,25 @@ def discover_repo_map(repo_root: str) -> Dict[str, str]:
     root = os.path.expanduser(repo_root)
     if not os.path.isdir(root):
         return out
+    # scandir's DirEntry.is_dir() reuses the d_type from readdir, so plain directories cost no
+    # extra stat; symlinks are still followed (repos are often linked into the root).
     try:
-        entries = os.listdir(root)
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if not entry.is_dir():
+                        continue
+                except OSError:
+                    continue
+                full_key = normalize_repo_key(entry.name)
+                if not full_key:
+                    continue
+                path = entry.path
+                out[full_key] = path
+                if full_key.startswith("recalldeck-"):
+                    out[full_key[len("recalldeck-") :]] = path
     except Exception:
-        return out
-
-    for name in entries:
-        path = os.path.join(root, name)
-        if not os.path.isdir(path):
-            continue
-        full_key = normalize_repo_key(name)
-        if not full_key:
-            continue
-        out[full_key] = path
-        if full_key.startswith("recalldeck-"):
-            out[full_key[len("recalldeck-") :]] = path
+        return {}
 
     # common aliases
     if "server" in out:
@@ -1064,7 +1427,12 @@ def discover_repo_map(repo_root: str) -> Dict[str, str]:
     return out
 
 
-def merge_repo_maps(*maps: Dict[str, str]) -> Dict[str, str]:
+def merge_repo_maps(*maps: Dict[str, str], verified: Tuple[Dict[str, str], ...] = ()) -> Dict[str, str]:
+    """Merge repo maps (later maps win) and drop entries whose path is not a directory.
+
+    Paths from `verified` maps (e.g. discover_repo_map output) were already checked as directories
+    and are not stat'ed again.
+    """
     out: Dict[str, str] = {}
     for m in maps:
         for k, v in (m or {}).items():
@@ -1073,9 +1441,13 @@ def merge_repo_maps(*maps: Dict[str, str]) -> Dict[str, str]:
                 continue
             out[kk] = os.path.expanduser(v)
     # prune obvious non-dirs; keep if empty (caller can decide)
+    # aliases often share a path, so stat each unique path once
+    is_dir: Dict[str, bool] = {p: True for m in verified for p in (m or {}).values() if isinstance(p, str)}
     pruned: Dict[str, str] = {}
     for k, p in out.items():
-        if os.path.isdir(p):
+        if p not in is_dir:
+            is_dir[p] = os.path.isdir(p)
+        if is_dir[p]:
             pruned[k] = p
     return pruned
 
@@ -1093,13 +1465,13 @@ def parse_repo_hint_with_source(
             if a.strip().lower() == "repo" and b.strip():
                 return b.strip(), "tag"
     if description:
-        m = REPO_RE.search(description)
-        if m:
-            return m.group(1).strip(), "description"
+        raw = parse_description_directives(description)[2]
+        if raw is not None:
+            return raw.strip(), "description"
     if allow_title_prefix and title:
         # Accept multi-segment prefixes like "Web/Playground:" by taking the
         # first segment as the repo hint.
-        m = re.match(r"^\s*([A-Za-z0-9_/-]+)\s*:\s*", title)
+        m = TITLE_REPO_PREFIX_RE.match(title)
         if m:
             raw = m.group(1).strip()
             hint = raw.split("/", 1)[0].strip()
@@ -1220,6 +1592,21 @@ def worker_is_alive(handle: Optional[str]) -> bool:
         return True
     return pid_alive(pid)
 
+def probe_workers_alive(handles: Iterable[str]) -> Dict[str, bool]:
+    """Run worker_is_alive for each distinct handle, overlapping the tmux subprocess waits.
+
+    Each tmux probe can block for up to 2s, so checking N inflight workers serially costs N
+    round trips; a small thread pool makes it roughly one.
+    """
+    uniq = list(dict.fromkeys(h for h in handles if h))
+    if not uniq:
+        return {}
+    if len(uniq) == 1 or WORKER_PROBE_CONCURRENCY <= 1:
+        return {h: worker_is_alive(h) for h in uniq}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(WORKER_PROBE_CONCURRENCY, len(uniq))) as ex:
+        return dict(zip(uniq, ex.map(worker_is_alive, uniq)))
+
+
 def reviewer_is_alive(handle: Optional[str]) -> bool:
     """Best-effort liveness check for reviewers.
 
@@ -1909,17 +2296,26 @@ def review_revision_matches(current: Optional[str], recorded: Optional[str]) ->
     return current == recorded
 
 
-def read_tail(path: str, max_bytes: int) -> str:
+def read_tail_bytes(path: str, max_bytes: int) -> bytes:
     try:
-        with open(path, "rb") as f:
-            if max_bytes > 0:
-                f.seek(0, os.SEEK_END)
-                size = f.tell()
-                f.seek(max(size - max_bytes, 0), os.SEEK_SET)
-            raw = f.read()
-        return raw.decode(errors="ignore")
+        size = os.stat(path).st_size
+        if max_bytes <= 0:
+            max_bytes = size
+        offset = max(size - max_bytes, 0)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if hasattr(os, "pread"):
+                return os.pread(fd, max_bytes, offset)
+            os.lseek(fd, offset, os.SEEK_SET)
+            return os.read(fd, max_bytes)
+        finally:
+            os.close(fd)
     except Exception:
-        return ""
+        return b""
+
+
+def read_tail(path: str, max_bytes: int) -> str:
+    return read_tail_bytes(path, max_bytes).decode(errors="ignore")
 
 def read_text(path: str, max_bytes: int = 20000) -> str:
     if not path or not os.path.isfile(path):
@@ -1960,11 +2356,11 @@ def detect_worker_completion(
     except Exception:
         log_mtime_ok = False
 
-    tail = read_tail(log_path, WORKER_LOG_TAIL_BYTES)
-    if tail and log_mtime_ok:
-        patch_match = PATCH_MARKER_RE.search(tail)
+    if log_mtime_ok:
+        tail = read_tail_bytes(log_path, WORKER_LOG_TAIL_BYTES)
+        patch_match = PATCH_MARKER_BYTES_RE.search(tail) if tail else None
         if patch_match:
-            p = patch_match.group(1)
+            p = patch_match.group(1).decode(errors="ignore")
             if p and os.path.isfile(p):
                 return {"logPath": log_path, "patchPath": p}
 
@@ -2069,22 +2465,10 @@ def parse_review_result(text: str) -> Optional[Dict[str, Any]]:
             idx = s2.find("{\"score\"")
         if idx < 0:
             return None
-        # Brace scan to extract one JSON object.
-        depth = 0
-        end = None
-        for i, ch in enumerate(s2[idx:], start=idx):
-            if ch == '{':
-                depth += 1
-            elif ch == '}':
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
-        if end is None:
-            return None
-        frag = s2[idx:end]
+        # Decode exactly one JSON object starting there; trailing text is ignored. raw_decode runs in
+        # the C scanner and, unlike a brace count, isn't thrown off by braces inside strings.
         try:
-            out = json.loads(frag)
+            out, _end = json.JSONDecoder().raw_decode(s2, idx)
             return out if isinstance(out, dict) else None
         except Exception:
             return None
@@ -2144,11 +2528,11 @@ def parse_review_result(text: str) -> Optional[Dict[str, Any]]:
             fix_plan = [str(x) for x in fp if str(x).strip()]
 
     if score is None:
-        score_match = re.search(r"score\s*[:=]\s*(\d{1,3})", parse_text, re.IGNORECASE)
+        score_match = REVIEW_SCORE_RE.search(parse_text)
         if score_match:
             score = score_match.group(1)
     if verdict is None:
-        verdict_match = re.search(r"verdict\s*[:=]\s*([A-Za-z]+)", parse_text, re.IGNORECASE)
+        verdict_match = REVIEW_VERDICT_RE.search(parse_text)
         if verdict_match:
             verdict = verdict_match.group(1)
 
@@ -2180,20 +2564,49 @@ def parse_review_result(text: str) -> Optional[Dict[str, Any]]:
 def detect_review_result(task_id: int, log_path: str) -> Optional[Dict[str, Any]]:
     if not log_path or not os.path.isfile(log_path):
         return None
-    tail = read_tail(log_path, REVIEWER_LOG_TAIL_BYTES)
-    if not tail:
+    raw = read_tail_bytes(log_path, REVIEWER_LOG_TAIL_BYTES)
+    if not raw:
         return None
-    marker = "### REVIEW START"
-    idx = tail.rfind(marker)
+    # Find the last review block on the raw bytes and decode only that slice.
+    idx = raw.rfind(REVIEW_START_MARKER)
     if idx >= 0:
-        tail = tail[idx:]
-    result = parse_review_result(tail)
+        raw = raw[idx:]
+    result = parse_review_result(raw.decode(errors="ignore"))
     if not result:
         return None
     result["logPath"] = log_path
     return result
 
 
+# Anything here means the spawn template needs /bin/sh (pipes, redirects, expansion, env prefixes).
+SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`*?\[\]~!#\n]")
+
+
+@functools.lru_cache(maxsize=8)
+def spawn_argv_template(template: str) -> Optional[Tuple[str, ...]]:
+    """Split a spawn command template into argv if it can be exec'd without a shell, else None."""
+    if not template or SHELL_SYNTAX_RE.search(template):
+        return None
+    try:
+        argv = tuple(shlex.split(template))
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
+def format_spawn_argv(template: str, **fields: Any) -> Optional[List[str]]:
+    """Format each argv element of `template` with raw (unquoted) field values; None => use the shell."""
+    argv = spawn_argv_template(template)
+    if argv is None:
+        return None
+    try:
+        return [part.format(**fields) for part in argv]
+    except Exception:
+        return None
+
+
 def format_worker_spawn_cmd(task_id: int, repo_key: Optional[str], repo_path: Optional[str]) -> Tuple[str, str, str]:
     safe_repo_key = repo_key or ""
     safe_repo_path = repo_path or ""
@@ -2212,10 +2625,14 @@ def spawn_worker(task_id: int, repo_key: Optional[str], repo_path: Optional[str]
     if not WORKER_SPAWN_CMD:
         return None
     cmd, safe_repo_key, safe_repo_path = format_worker_spawn_cmd(task_id, repo_key, repo_path)
+    # Exec simple templates directly (skips the /bin/sh fork); fall back to the shell otherwise.
+    argv = format_spawn_argv(
+        WORKER_SPAWN_CMD, task_id=task_id, repo_key=safe_repo_key, repo_path=safe_repo_path
+    )
     try:
         out = subprocess.run(
-            cmd,
-            shell=True,
+            argv if argv is not None else cmd,
+            shell=argv is None,
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -2312,10 +2729,17 @@ def spawn_docs_worker(
     cmd, safe_repo_key, safe_repo_path, safe_patch_path = format_docs_spawn_cmd(
         task_id, source_repo_key, source_repo_path, source_patch_path
     )
+    argv = format_spawn_argv(
+        DOCS_SPAWN_CMD,
+        task_id=task_id,
+        repo_key=safe_repo_key,
+        repo_path=safe_repo_path,
+        patch_path=safe_patch_path,
+    )
     try:
         out = subprocess.run(
-            cmd,
-            shell=True,
+            argv if argv is not None else cmd,
+            shell=argv is None,
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -2389,21 +2813,31 @@ def spawn_reviewer(
     safe_repo_path = repo_path or ""
     safe_patch_path = patch_path or ""
     safe_review_revision = review_revision or ""
+    default_log_path = default_reviewer_log_path(task_id)
     try:
         cmd = REVIEWER_SPAWN_CMD.format(
             task_id=task_id,
             repo_key=shlex.quote(safe_repo_key),
             repo_path=shlex.quote(safe_repo_path),
             patch_path=shlex.quote(safe_patch_path),
-            log_path=shlex.quote(default_reviewer_log_path(task_id)),
+            log_path=shlex.quote(default_log_path),
             review_revision=shlex.quote(safe_review_revision),
         )
     except Exception:
         cmd = REVIEWER_SPAWN_CMD
+    argv = format_spawn_argv(
+        REVIEWER_SPAWN_CMD,
+        task_id=task_id,
+        repo_key=safe_repo_key,
+        repo_path=safe_repo_path,
+        patch_path=safe_patch_path,
+        log_path=default_log_path,
+        review_revision=safe_review_revision,
+    )
     try:
         out = subprocess.run(
-            cmd,
-            shell=True,
+            argv if argv is not None else cmd,
+            shell=argv is None,
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -2462,6 +2896,77 @@ def spawn_reviewer(
 
 def set_task_tags(pid: int, task_id: int, tags: List[str]) -> None:
     rpc("setTaskTags", [pid, task_id, tags])
+    _task_tags_cache[int(task_id)] = list(tags)
+    # A full-list write supersedes anything queued for this task.
+    _task_tags_pending.pop(int(task_id), None)
+
+
+def queue_task_tags(task_id: int, tags: List[str]) -> None:
+    """Record the desired tags for a task; flush_task_tags() writes them.
+
+    The change is kept as adds/removes against the current cached tags, not as a full list, so a
+    tag someone else changes during the run isn't reverted. Several steps on one task collapse into
+    a single setTaskTags (or none, if they cancel out). Reads see the queued tags immediately via
+    the tag cache.
+    """
+    tid = int(task_id)
+    current = _task_tags_cache.get(tid) or []
+    before = {t.strip().lower() for t in current}
+    after = {t.strip().lower(): t for t in tags}
+    adds, removes = _task_tags_pending.setdefault(tid, ({}, set()))
+    for key, tag in after.items():
+        if key in before:
+            continue
+        if key in removes:
+            removes.discard(key)
+        else:
+            adds[key] = tag
+    for key in before - after.keys():
+        if key in adds:
+            adds.pop(key)
+        else:
+            removes.add(key)
+    _task_tags_cache[tid] = list(tags)
+
+
+def flush_task_tags(pid: int) -> List[str]:
+    """Write queued tag changes and return an error line per task whose read or write failed.
+
+    Pending adds/removes are applied to tags re-read in one batch, and only tasks whose tags change
+    are written. A failed task is dropped (next run re-plans it); the caller surfaces it in the
+    run's errors.
+    """
+    pending = {tid: delta for tid, delta in _task_tags_pending.items() if delta[0] or delta[1]}
+    _task_tags_pending.clear()
+    if not pending:
+        return []
+
+    failures: List[str] = []
+    tids = list(pending)
+    fresh = rpc_batch([("getTaskTags", {"task_id": tid}) for tid in tids], return_exceptions=True)
+    writes: Dict[int, List[str]] = {}
+    for tid, r in zip(tids, fresh):
+        if isinstance(r, Exception):
+            _task_tags_cache.pop(tid, None)
+            failures.append(f"Failed to update tags on #{tid}: {r}")
+            continue
+        adds, removes = pending[tid]
+        current = list((r or {}).values())
+        present = {t.strip().lower() for t in current}
+        new_tags = [t for t in current if t.strip().lower() not in removes]
+        new_tags += [t for key, t in adds.items() if key not in present]
+        _task_tags_cache[tid] = list(new_tags)
+        if new_tags != current:
+            writes[tid] = new_tags
+
+    if writes:
+        wids = list(writes)
+        res = rpc_batch([("setTaskTags", [pid, tid, writes[tid]]) for tid in wids], return_exceptions=True)
+        for tid, r in zip(wids, res):
+            if isinstance(r, Exception):
+                _task_tags_cache.pop(tid, None)
+                failures.append(f"Failed to update tags on #{tid}: {r}")
+    return failures
 
 
 def move_task(pid: int, task_id: int, column_id: int, position: int, swimlane_id: int) -> None:
@@ -2475,6 +2980,7 @@ def move_task(pid: int, task_id: int, column_id: int, position: int, swimlane_id
             "swimlane_id": swimlane_id,
         },
     )
+    _task_cache.pop(int(task_id), None)
 
 
 def create_task(
@@ -2508,7 +3014,15 @@ def pick_top_task(col: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if not tasks:
         return None
     # Kanboard 'position' is 1..n; smaller = higher
-    return sorted(tasks, key=lambda t: int(t.get("position") or 10**9))[0]
+    return min(tasks, key=lambda t: int(t.get("position") or 10**9))
+
+
+def index_columns(columns: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    # title -> column; first column with a given title wins, matching find_column().
+    out: Dict[str, Dict[str, Any]] = {}
+    for c in columns:
+        out.setdefault((c.get("title") or "").strip(), c)
+    return out
 
 
 def find_column(columns: List[Dict[str, Any]], title: str) -> Optional[Dict[str, Any]]:
@@ -2522,8 +3036,28 @@ def task_title(t: Dict[str, Any]) -> str:
     return (t.get("title") or "").strip()
 
 
-def is_held(tags: List[str]) -> bool:
-    lower = {x.lower() for x in tags}
+def task_description(t: Dict[str, Any]) -> str:
+    """Description from a board task payload; falls back to (cached) getTask when the payload lacks it."""
+    desc = t.get("description")
+    if desc is None:
+        desc = get_task(int(t.get("id"))).get("description")
+    return desc or ""
+
+
+def tag_set(tags: Iterable[str]) -> frozenset:
+    """Lowercased tag set for membership checks.
+
+    The is_*/has_tag helpers accept either a tag list or a tag_set(); callers that test the same
+    tags several times should build the set once and pass it in. A frozenset argument is assumed
+    to come from tag_set() (already lowercased) and is used as-is.
+    """
+    if isinstance(tags, frozenset):
+        return tags
+    return frozenset(x.lower() for x in tags)
+
+
+def is_held(tags: Iterable[str]) -> bool:
+    lower = tag_set(tags)
     if TAG_HOLD in lower or TAG_NOAUTO in lower or any(t.startswith("hold:") for t in lower):
         return True
     # Treat any paused tag as an explicit "do not advance/start" escape hatch.
@@ -2537,21 +3071,21 @@ def is_held(tags: List[str]) -> bool:
     return False
 
 
-def is_epic(tags: List[str]) -> bool:
-    return TAG_EPIC in {x.lower() for x in tags}
+def is_epic(tags: Iterable[str]) -> bool:
+    return TAG_EPIC in tag_set(tags)
 
 
-def is_critical(tags: List[str]) -> bool:
-    return TAG_CRITICAL in {x.lower() for x in tags}
+def is_critical(tags: Iterable[str]) -> bool:
+    return TAG_CRITICAL in tag_set(tags)
 
-def is_hard_hold(tags: List[str]) -> bool:
+def is_hard_hold(tags: Iterable[str]) -> bool:
     """Hard holds are human intent to stop automation.
 
     We intentionally *do not* treat paused/blocked tags as hard holds for purposes
     of critical selection. A critical task may be paused/blocked and should still
     freeze throughput until it is resolved.
     """
-    lower = {x.lower() for x in tags}
+    lower = tag_set(tags)
     orchestrator_holds = {TAG_HOLD_QUEUED_CRITICAL, TAG_HOLD_DEPS, TAG_HOLD_NEEDS_REPO}
     # Legacy: some older runs incorrectly added plain `hold` alongside `hold:queued-critical`.
     # In that case, treat it as orchestrator-managed and allow selection so we can unqueue.
@@ -2568,20 +3102,31 @@ def is_hard_hold(tags: List[str]) -> bool:
     return False
 
 
-def has_tag(tags: List[str], tag: str) -> bool:
-    return tag.lower() in {x.lower() for x in tags}
+def has_tag(tags: Iterable[str], tag: str) -> bool:
+    return tag.lower() in tag_set(tags)
 
 
 def breakdown_title(epic_id: int, epic_title: str) -> str:
     return f"Break down epic #{epic_id}: {epic_title}".strip()
 
 
-def find_existing_breakdown(all_tasks: List[Tuple[Dict[str, Any], int]], target_title: str) -> Optional[int]:
-    # all_tasks: (task, swimlane_id)
+def index_task_titles(all_tasks: Iterable[Tuple[Dict[str, Any], int]]) -> Dict[str, int]:
+    # all_tasks: (task, swimlane_id). First task with a given title wins (board order).
+    out: Dict[str, int] = {}
     for t, _sw in all_tasks:
-        if task_title(t) == target_title:
-            return int(t.get("id"))
-    return None
+        out.setdefault(task_title(t), int(t.get("id")))
+    return out
+
+
+def write_json_line(payload: Dict[str, Any]) -> None:
+    # Stream straight to stdout (looked up per call so redirects work) instead of building
+    # the whole document as an intermediate string first.
+    if orjson is not None:
+        # orjson emits compact UTF-8, matching separators=(",", ":") + ensure_ascii=False.
+        sys.stdout.write(orjson.dumps(payload).decode("utf-8"))
+    else:
+        json.dump(payload, sys.stdout, separators=(",", ":"), ensure_ascii=False)
+    sys.stdout.write("\n")
 
 
 def emit_json(
@@ -2606,7 +3151,7 @@ def emit_json(
         "createdTasks": created_tasks,
         "errors": errors,
     }
-    print(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+    write_json_line(payload)
 
 
 def main() -> int:
@@ -2616,7 +3161,9 @@ def main() -> int:
         print("NO_REPLY")
         return 0
 
+    pid: Optional[int] = None
     try:
+        reset_task_caches()
         state = load_state()
         if WORKER_LEASES_ENABLED:
             try:
@@ -2627,13 +3174,25 @@ def main() -> int:
         # Repo mapping (self-healing):
         # - Merge any persisted mapping with optional JSON mapping file and
         #   auto-discovered repos under REPO_ROOT.
+        # The inputs rarely change, so skip the rebuild while the repo root and map file mtimes
+        # match the ones recorded with the persisted map.
         existing_repo_map = state.get("repoMap") or {}
-        file_repo_map = load_repo_map_from_file(REPO_MAP_PATH)
-        discovered_repo_map = discover_repo_map(REPO_ROOT)
-        if file_repo_map or discovered_repo_map:
-            merged_repo_map = merge_repo_maps(existing_repo_map, file_repo_map, discovered_repo_map)
-            if merged_repo_map:
-                state["repoMap"] = merged_repo_map
+        repo_map_source = [
+            REPO_ROOT,
+            path_mtime_ns(os.path.expanduser(REPO_ROOT)) if REPO_ROOT else None,
+            REPO_MAP_PATH,
+            path_mtime_ns(REPO_MAP_PATH) if REPO_MAP_PATH else None,
+        ]
+        if not existing_repo_map or state.get("repoMapSource") != repo_map_source:
+            file_repo_map = load_repo_map_from_file(REPO_MAP_PATH)
+            discovered_repo_map = discover_repo_map(REPO_ROOT)
+            if file_repo_map or discovered_repo_map:
+                merged_repo_map = merge_repo_maps(
+                    existing_repo_map, file_repo_map, discovered_repo_map, verified=(discovered_repo_map,)
+                )
+                if merged_repo_map:
+                    state["repoMap"] = merged_repo_map
+            state["repoMapSource"] = repo_map_source
         repo_map: Dict[str, str] = (state.get("repoMap") or {})
         repo_by_task: Dict[str, Any] = (state.get("repoByTaskId") or {})
         auto_blocked: Dict[str, Any] = (state.get("autoBlockedByOrchestrator") or {})
@@ -2668,13 +3227,14 @@ def main() -> int:
             return 0
 
         columns = swimlanes[0].get("columns") or []
-        col_backlog = find_column(columns, COL_BACKLOG)
-        col_ready = find_column(columns, COL_READY)
-        col_wip = find_column(columns, COL_WIP)
-        col_review = find_column(columns, COL_REVIEW)
-        col_docs = find_column(columns, COL_DOCUMENTATION)
-        col_blocked = find_column(columns, COL_BLOCKED)
-        col_done = find_column(columns, COL_DONE)
+        col_by_title = index_columns(columns)
+        col_backlog = col_by_title.get(COL_BACKLOG)
+        col_ready = col_by_title.get(COL_READY)
+        col_wip = col_by_title.get(COL_WIP)
+        col_review = col_by_title.get(COL_REVIEW)
+        col_docs = col_by_title.get(COL_DOCUMENTATION)
+        col_blocked = col_by_title.get(COL_BLOCKED)
+        col_done = col_by_title.get(COL_DONE)
 
         missing = [
             name
@@ -2694,19 +3254,42 @@ def main() -> int:
             print("RecallDeck board orchestrator: missing columns: " + ", ".join(missing))
             return 0
 
-        # Gather tasks across swimlanes
+        # Column ids are fixed for the run; resolve them once.
+        backlog_column_id = int(col_backlog["id"])
+        ready_column_id = int(col_ready["id"])
+        wip_column_id = int(col_wip["id"])
+        review_column_id = int(col_review["id"])
+        blocked_column_id = int(col_blocked["id"])
+        done_column_id = int(col_done["id"])
+        docs_column_id: Optional[int] = int(col_docs["id"]) if col_docs is not None else None
+
+        # Gather tasks across swimlanes: index the snapshot by column once instead of walking
+        # every swimlane x column for each lookup.
+        # The same pass collects every open (not Done) card in board order as (task, swimlane_id, column_id).
+        tasks_by_col: Dict[int, List[Tuple[Dict[str, Any], int]]] = collections.defaultdict(list)
+        sl_name_by_id: Dict[int, Any] = {}
+        all_open: List[Tuple[Dict[str, Any], int, int]] = []
+        for sl in swimlanes:
+            sl_id = int(sl.get("id") or 0)
+            sl_name_by_id.setdefault(sl_id, sl.get("name"))
+            for c in (sl.get("columns") or []):
+                col_id = int(c.get("id") or 0)
+                col_tasks = c.get("tasks") or []
+                tasks_by_col[col_id].extend((t, sl_id) for t in col_tasks)
+                if col_id != done_column_id:
+                    all_open.extend((t, sl_id, col_id) for t in col_tasks)
+
         def tasks_for_column(col_id: int) -> List[Tuple[Dict[str, Any], int]]:
-            out: List[Tuple[Dict[str, Any], int]] = []
-            for sl in swimlanes:
-                for c in (sl.get("columns") or []):
-                    if int(c.get("id")) == int(col_id):
-                        for t in (c.get("tasks") or []):
-                            out.append((t, int(sl.get("id") or 0)))
-            return out
+            return list(tasks_by_col.get(int(col_id)) or [])
 
-        done_column_id = int(col_done["id"])
+        # Cards in the Done column of the snapshot stay done (nothing moves cards out of Done), so deps on
+        # them resolve without a getTask. Others (closed cards, cards moved to Done this run) still fall
+        # through to get_task.
+        done_ids = {int(t.get("id")) for t, _sl in tasks_by_col.get(done_column_id) or []}
 
         def is_done(task_id: int) -> bool:
+            if int(task_id) in done_ids:
+                return True
             try:
                 t = get_task(task_id)
                 return int(t.get("column_id") or 0) == done_column_id
@@ -2716,16 +3299,16 @@ def main() -> int:
         # Drift check: if a task is in WIP but we have no recorded worker handle, flag it.
         workers_by_task = (state.get("workersByTaskId") or {})
 
-        wip_tasks = tasks_for_column(int(col_wip["id"]))
-        ready_tasks = tasks_for_column(int(col_ready["id"]))
-        backlog_tasks = tasks_for_column(int(col_backlog["id"]))
-        review_tasks = tasks_for_column(int(col_review["id"]))
+        wip_tasks = tasks_for_column(wip_column_id)
+        ready_tasks = tasks_for_column(ready_column_id)
+        backlog_tasks = tasks_for_column(backlog_column_id)
+        review_tasks = tasks_for_column(review_column_id)
         docs_tasks: List[Tuple[Dict[str, Any], int]] = []
-        if col_docs is not None:
-            docs_tasks = tasks_for_column(int(col_docs["id"]))
+        if docs_column_id is not None:
+            docs_tasks = tasks_for_column(docs_column_id)
         # Paused is now tag-based; the Paused column is optional/legacy.
-        blocked_tasks = tasks_for_column(int(col_blocked["id"]))
-        done_tasks = tasks_for_column(int(col_done["id"]))
+        blocked_tasks = tasks_for_column(blocked_column_id)
+        done_tasks = tasks_for_column(done_column_id)
 
         review_ids = {int(t.get("id")) for t, _sl in review_tasks}
         docs_ids = {int(t.get("id")) for t, _sl in docs_tasks}
@@ -2761,7 +3344,6 @@ def main() -> int:
 
         # Self-heal state: drop stale bookkeeping for tasks no longer in those columns.
         blocked_ids = {int(t.get("id")) for t, _sl in blocked_tasks}
-        done_ids = {int(t.get("id")) for t, _sl in done_tasks}
         for k in list(auto_blocked.keys()):
             try:
                 if int(k) not in blocked_ids:
@@ -2810,24 +3392,23 @@ def main() -> int:
             t = item[0]
             sl_id = item[1]
             # swimlane priority index
-            sl_name = None
-            for sl in swimlanes:
-                if int(sl.get("id") or 0) == sl_id:
-                    sl_name = sl.get("name")
-                    break
+            sl_name = sl_name_by_id.get(sl_id)
             pri_list = state.get("swimlanePriority") or ["Default swimlane"]
             pri = pri_list.index(sl_name) if sl_name in pri_list else len(pri_list)
             return (pri, int(t.get("position") or 10**9))
 
         # Determine critical queue early so drift checks don't flag queued criticals.
-        all_open: List[Tuple[Dict[str, Any], int, int]] = []
-        for sl in swimlanes:
-            for c in (sl.get("columns") or []):
-                col_id = int(c.get("id") or 0)
-                if col_id == int(col_done["id"]):
-                    continue
-                for t in (c.get("tasks") or []):
-                    all_open.append((t, int(sl.get("id") or 0), col_id))
+        # One batched round-trip for the tags of every open card (critical scan, WIP drift, selection)
+        # plus full task details for the in-flight columns, whose descriptions are read for repo
+        # resolution, exclusive keys, drift checks and docs runs. Backlog details stay lazy: selection
+        # usually stops after the first few candidates.
+        inflight_column_ids = {ready_column_id, wip_column_id, review_column_id}
+        if docs_column_id is not None:
+            inflight_column_ids.add(docs_column_id)
+        prefetch_task_details(
+            [int(t.get("id")) for t, _sl_id, col_id in all_open if col_id in inflight_column_ids],
+            [int(t.get("id")) for t, _sl_id, _col_id in all_open],
+        )
 
         critical_candidates: List[Tuple[Dict[str, Any], int, int]] = []
         critical_task_ids: set[int] = set()
@@ -2840,15 +3421,16 @@ def main() -> int:
             # Critical queueing uses `hold:queued-critical` as an orchestrator-managed fence.
             # Those cards are "held" for normal flow, but MUST still be considered for
             # critical selection so we can unqueue them when they become active.
-            if is_critical(tags) and (not is_hard_hold(tags)):
+            tset = tag_set(tags)
+            if is_critical(tset) and (not is_hard_hold(tset)):
                 critical_candidates.append((t, sl_id, col_id))
                 critical_task_ids.add(tid)
 
         active_critical, queued_critical = pick_critical_queue(
             critical_candidates,
-            int(col_wip["id"]),
-            int(col_review["id"]),
-            int(col_ready["id"]),
+            wip_column_id,
+            review_column_id,
+            ready_column_id,
             sort_key,
         )
         queued_critical_ids = {int(t.get("id")) for t, _sl_id, _col_id in queued_critical}
@@ -2868,11 +3450,13 @@ def main() -> int:
                 active_critical_col_id = None
             if active_critical_col_id is not None:
                 if CRITICAL_FREEZE_ALL:
-                    critical_exclusive = active_critical_col_id != int(col_done["id"])
+                    critical_exclusive = active_critical_col_id != done_column_id
                 else:
-                    critical_exclusive = active_critical_col_id == int(col_wip["id"])
+                    critical_exclusive = active_critical_col_id == wip_column_id
 
         wip_count = len(wip_tasks)
+        # Memoized; any path that changes WIP membership or pauses/resumes a WIP card must
+        # call invalidate_wip_active_count().
         wip_active_count_cache: Optional[int] = None
 
         def wip_active_count() -> int:
@@ -2895,6 +3479,12 @@ def main() -> int:
             nonlocal wip_active_count_cache
             wip_active_count_cache = None
 
+        def note_wip_started() -> None:
+            # A card that just started was checked unheld, so the count moves by one; no recount.
+            nonlocal wip_active_count_cache
+            if wip_active_count_cache is not None:
+                wip_active_count_cache += 1
+
         actions: List[str] = []
         promoted_to_ready: List[int] = []
         moved_to_wip: List[int] = []
@@ -2912,6 +3502,25 @@ def main() -> int:
         missing_worker_tasks: List[Tuple[Dict[str, Any], int]] = []
 
         # Drift: WIP tasks missing worker handle and/or repo mapping
+        # Probe inflight workers (done.json not written yet) up front and in parallel.
+        inflight_handles: List[str] = []
+        for t, _sl_id in wip_tasks:
+            ptid = int(t.get("id"))
+            if ptid in queued_critical_ids:
+                continue
+            try:
+                ptset = tag_set(get_task_tags(ptid))
+                if is_held(ptset) and not is_critical(ptset):
+                    continue
+            except Exception:
+                pass
+            entry = worker_entry_for(ptid, workers_by_task)
+            if isinstance(entry, dict):
+                dp = entry.get("donePath") or entry.get("done_path") or ""
+                h = worker_handle(entry)
+                if dp and h and not os.path.isfile(str(dp)):
+                    inflight_handles.append(h)
+        alive_by_handle = probe_workers_alive(inflight_handles)
         for t, sl_id in wip_tasks:
             tid = int(t.get("id"))
             title = task_title(t)
@@ -2929,7 +3538,8 @@ def main() -> int:
 
             # If a card is explicitly paused/held, don't keep trying to respawn workers every tick.
             # Exception: critical cards can still be reconciled.
-            reconcile_worker = (not is_held(tags)) or is_critical(tags)
+            tset = tag_set(tags)
+            reconcile_worker = (not is_held(tset)) or is_critical(tset)
             if reconcile_worker:
                 entry = worker_entry_for(tid, workers_by_task)
 
@@ -2954,7 +3564,7 @@ def main() -> int:
                     # If the tmux window/handle is gone, treat the run as stale immediately
                     # (otherwise we can get stuck waiting for done.json until the timeout).
                     h = worker_handle(entry)
-                    if h and not worker_is_alive(h):
+                    if h and not (alive_by_handle[h] if h in alive_by_handle else worker_is_alive(h)):
                         workers_by_task.pop(str(tid), None)
                         workers_by_task.pop(tid, None)
                         missing_worker_tasks.append((t, sl_id))
@@ -2995,12 +3605,16 @@ def main() -> int:
         last_actions_prev = state.get("lastActionsByTaskId") or {}
         last_actions = dict(last_actions_prev)
         cooldown_ms = TASK_COOLDOWN_MIN * 60 * 1000
+        # Cooldowns are judged against the run's start time too: one clock read, and a card's verdict
+        # can't flip partway through the tick.
+        cooldown_cutoff_ms = now_ms() - cooldown_ms
 
         def cooled(task_id: int) -> bool:
             last = int(last_actions_prev.get(str(task_id), 0) or 0)
-            return (now_ms() - last) >= cooldown_ms
+            return last <= cooldown_cutoff_ms
 
         def record_action(task_id: int) -> None:
+            # In-memory only; lastActionsByTaskId is persisted once by save_state() when the run exits.
             last_actions[str(task_id)] = now_ms()
 
         comment_user_id: Optional[int] = None
@@ -3022,7 +3636,7 @@ def main() -> int:
                 if has_tag(tags, tag):
                     return
                 # Kanboard expects full tag list
-                set_task_tags(pid, task_id, tags + [tag])
+                queue_task_tags(task_id, tags + [tag])
             except Exception:
                 pass
 
@@ -3031,7 +3645,7 @@ def main() -> int:
                 tags = get_task_tags(task_id)
                 new_tags = [t for t in tags if t.strip().lower() != tag.strip().lower()]
                 if new_tags != tags:
-                    set_task_tags(pid, task_id, new_tags)
+                    queue_task_tags(task_id, new_tags)
             except Exception:
                 pass
 
@@ -3045,7 +3659,7 @@ def main() -> int:
                         merged.append(t)
                         lower.add(t.lower())
                 if merged != existing:
-                    set_task_tags(pid, task_id, merged)
+                    queue_task_tags(task_id, merged)
             except Exception:
                 pass
 
@@ -3055,10 +3669,23 @@ def main() -> int:
                 remove_lower = {t.lower() for t in tags_to_remove if t}
                 new_tags = [t for t in existing if t.strip().lower() not in remove_lower]
                 if new_tags != existing:
-                    set_task_tags(pid, task_id, new_tags)
+                    queue_task_tags(task_id, new_tags)
             except Exception:
                 pass
 
+        def tag_auto_blocked(task_id: int, reason_tag: str) -> bool:
+            """Add reason_tag + auto-blocked unless both are already there; True if tags changed."""
+            try:
+                existing = get_task_tags(task_id)
+            except Exception:
+                existing = []
+            lower = tag_set(existing or [])
+            if reason_tag.lower() in lower and TAG_AUTO_BLOCKED.lower() in lower:
+                return False
+            add_tags(task_id, [reason_tag, TAG_AUTO_BLOCKED])
+            record_action(task_id)
+            return True
+
         def clear_paused_tags(task_id: int) -> None:
             """Remove paused tags that prevent automation from advancing cards.
 
@@ -3076,10 +3703,7 @@ def main() -> int:
             new_tags = [t for t in existing if not (t.strip().lower() == TAG_PAUSED or t.strip().lower().startswith("paused:"))]
             # Kanboard expects the full tag list on set; only write when changed.
             if new_tags != existing:
-                try:
-                    set_task_tags(pid, task_id, new_tags)
-                except Exception:
-                    pass
+                queue_task_tags(task_id, new_tags)
 
         def add_comment(task_id: int, comment: str) -> None:
             if not comment:
@@ -3237,14 +3861,7 @@ def main() -> int:
                                     f"Would tag WIP #{task_id} as {reason_tag} (provider {provider} {category2}: {msg2})"
                                 )
                             else:
-                                try:
-                                    existing = get_task_tags(task_id)
-                                except Exception:
-                                    existing = []
-                                lower = {t.lower() for t in (existing or [])}
-                                if reason_tag.lower() not in lower or TAG_AUTO_BLOCKED.lower() not in lower:
-                                    add_tags(task_id, [reason_tag, TAG_AUTO_BLOCKED])
-                                    record_action(task_id)
+                                if tag_auto_blocked(task_id, reason_tag):
                                     actions.append(
                                         f"Tagged WIP #{task_id} as {reason_tag} (provider {provider} {category2}: {msg2})"
                                     )
@@ -3277,14 +3894,7 @@ def main() -> int:
                                 f"Would tag WIP #{task_id} as {reason_tag} (provider {provider} {category2}: {msg2})"
                             )
                         else:
-                            try:
-                                existing = get_task_tags(task_id)
-                            except Exception:
-                                existing = []
-                            lower = {t.lower() for t in (existing or [])}
-                            if reason_tag.lower() not in lower or TAG_AUTO_BLOCKED.lower() not in lower:
-                                add_tags(task_id, [reason_tag, TAG_AUTO_BLOCKED])
-                                record_action(task_id)
+                            if tag_auto_blocked(task_id, reason_tag):
                                 actions.append(
                                     f"Tagged WIP #{task_id} as {reason_tag} (provider {provider} {category2}: {msg2})"
                                 )
@@ -3481,14 +4091,7 @@ def main() -> int:
                             f"Would tag WIP #{task_id} as {reason_tag} (provider {provider} {category2}: {msg2})"
                         )
                     else:
-                        try:
-                            existing = get_task_tags(task_id)
-                        except Exception:
-                            existing = []
-                        lower = {t.lower() for t in (existing or [])}
-                        if reason_tag.lower() not in lower or TAG_AUTO_BLOCKED.lower() not in lower:
-                            add_tags(task_id, [reason_tag, TAG_AUTO_BLOCKED])
-                            record_action(task_id)
+                        if tag_auto_blocked(task_id, reason_tag):
                             actions.append(
                                 f"Tagged WIP #{task_id} as {reason_tag} (provider {provider} {category2}: {msg2})"
                             )
@@ -3640,14 +4243,7 @@ def main() -> int:
                                 f"Would tag Documentation #{task_id} as {reason_tag} (provider {provider} {category}: {msg})"
                             )
                         else:
-                            try:
-                                existing = get_task_tags(task_id)
-                            except Exception:
-                                existing = []
-                            lower = {t.lower() for t in (existing or [])}
-                            if reason_tag.lower() not in lower or TAG_AUTO_BLOCKED.lower() not in lower:
-                                add_tags(task_id, [reason_tag, TAG_AUTO_BLOCKED])
-                                record_action(task_id)
+                            if tag_auto_blocked(task_id, reason_tag):
                                 actions.append(
                                     f"Tagged Documentation #{task_id} as {reason_tag} (provider {provider} {category}: {msg})"
                                 )
@@ -3689,14 +4285,7 @@ def main() -> int:
                                 f"Would tag Review #{task_id} as {reason_tag} (provider {provider} {category}: {msg})"
                             )
                         else:
-                            try:
-                                existing = get_task_tags(task_id)
-                            except Exception:
-                                existing = []
-                            lower = {t.lower() for t in (existing or [])}
-                            if reason_tag.lower() not in lower or TAG_AUTO_BLOCKED.lower() not in lower:
-                                add_tags(task_id, [reason_tag, TAG_AUTO_BLOCKED])
-                                record_action(task_id)
+                            if tag_auto_blocked(task_id, reason_tag):
                                 actions.append(
                                     f"Tagged Review #{task_id} as {reason_tag} (provider {provider} {category}: {msg})"
                                 )
@@ -3733,7 +4322,7 @@ def main() -> int:
                 actions.append(f"Tagged {label} #{task_id} ({title}) as paused:missing-worker ({reason})")
                 # Keep WIP/Ready clean: paused cards shouldn't sit in active columns.
                 try:
-                    move_task(pid, task_id, int(col_blocked["id"]), 1, int(sl_id))
+                    move_task(pid, task_id, blocked_column_id, 1, int(sl_id))
                 except Exception:
                     pass
             return True
@@ -3770,7 +4359,7 @@ def main() -> int:
                 remove_tags(task_id, [TAG_NO_REPO, TAG_HOLD])
                 maybe_comment_needs_repo(task_id)
             try:
-                move_task(pid, task_id, int(col_backlog["id"]), 1, int(sl_id))
+                move_task(pid, task_id, backlog_column_id, 1, int(sl_id))
             except Exception:
                 pass
             actions.append(f"Kept {from_label} #{task_id} ({title}) in Backlog; tagged {reason_tag}: {reason}")
@@ -3783,6 +4372,10 @@ def main() -> int:
                 payload["source"] = source
             repo_by_task[str(task_id)] = payload
 
+        # Per-run memo for resolve_repo_for_task, keyed by every input so edited tags/descriptions
+        # re-resolve. Saves the repeated hint parsing and isdir() checks across the run's passes.
+        repo_resolution_memo: Dict[Tuple[Any, ...], Tuple[bool, Optional[str], Optional[str], Optional[str]]] = {}
+
         def resolve_repo_for_task(
             task_id: int,
             title: str,
@@ -3790,6 +4383,27 @@ def main() -> int:
             description: str,
             *,
             require_explicit: bool = False,
+        ) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
+            memo_key = (int(task_id), title, tuple(tags), description, require_explicit)
+            hit = repo_resolution_memo.get(memo_key)
+            if hit is not None:
+                ok, repo_key, repo_path, source = hit
+                if ok and str(task_id) not in repo_by_task:
+                    record_repo(task_id, repo_key, repo_path, source)
+                return hit
+            res = resolve_repo_for_task_uncached(
+                task_id, title, tags, description, require_explicit=require_explicit
+            )
+            repo_resolution_memo[memo_key] = res
+            return res
+
+        def resolve_repo_for_task_uncached(
+            task_id: int,
+            title: str,
+            tags: List[str],
+            description: str,
+            *,
+            require_explicit: bool = False,
         ) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
             if has_tag(tags, TAG_NO_REPO):
                 # Explicit opt-out: allow automation to proceed without a repo path.
@@ -3831,7 +4445,7 @@ def main() -> int:
         # Hygiene: replace ambiguous plain `hold` with explicit hold reasons.
         # Best-effort; do not scan endlessly in a single tick.
         def normalize_plain_hold(task_id: int, tags: List[str]) -> bool:
-            lower = {t.lower() for t in (tags or [])}
+            lower = tag_set(tags or [])
             if TAG_HOLD not in lower:
                 return False
             has_reason = any(t.startswith("hold:") for t in lower)
@@ -3879,7 +4493,7 @@ def main() -> int:
                 except Exception:
                     btags = []
 
-                lower = {t.lower() for t in (btags or [])}
+                lower = tag_set(btags or [])
                 if not (
                     TAG_PAUSED_MISSING_WORKER in lower
                     or THRASH_PAUSE_TAG in lower
@@ -3897,7 +4511,7 @@ def main() -> int:
                 if dry_run:
                     actions.append(f"Would move Blocked #{bid} ({btitle}) -> Review (worker output complete)")
                 else:
-                    move_task(pid, bid, int(col_review["id"]), 1, int(bsl_id))
+                    move_task(pid, bid, review_column_id, 1, int(bsl_id))
                     record_action(bid)
                     remove_tags(
                         bid,
@@ -4002,7 +4616,7 @@ def main() -> int:
                 if dry_run:
                     actions.append(f"Would move WIP #{wid} ({wtitle}) -> Review (worker output complete)")
                 else:
-                    move_task(pid, wid, int(col_review["id"]), 1, wsl_id)
+                    move_task(pid, wid, review_column_id, 1, wsl_id)
                     record_action(wid)
                     # Mark this review as auto-managed.
                     remove_tags(
@@ -4031,16 +4645,18 @@ def main() -> int:
                 budget -= 1
 
         if completed_wip_ids:
-            wip_tasks = [(t, sl_id) for t, sl_id in wip_tasks if int(t.get("id")) not in completed_wip_ids]
+            # One filtering pass per list with O(1) membership (completed_wip_ids is a list).
+            completed_wip_id_set = set(completed_wip_ids)
+            wip_tasks = [(t, sl_id) for t, sl_id in wip_tasks if int(t.get("id")) not in completed_wip_id_set]
             wip_count = len(wip_tasks)
             missing_worker_tasks = [
-                (t, sl_id) for t, sl_id in missing_worker_tasks if int(t.get("id")) not in completed_wip_ids
+                (t, sl_id) for t, sl_id in missing_worker_tasks if int(t.get("id")) not in completed_wip_id_set
             ]
-            stale_worker_ids.difference_update(set(completed_wip_ids))
+            stale_worker_ids.difference_update(completed_wip_id_set)
             invalidate_wip_active_count()
 
         # Reconcile WIP tasks missing worker handles: spawn or pause deterministically.
-        paused_missing_worker_ids: List[int] = []
+        paused_missing_worker_ids: set[int] = set()
         if budget > 0 and missing_worker_tasks:
             for wt, wsl_id in sorted(missing_worker_tasks, key=sort_key):
                 if budget <= 0:
@@ -4058,7 +4674,8 @@ def main() -> int:
                 repo_ok, repo_key, repo_path, _source = resolve_repo_for_task(
                     wid, wtitle, wtags, wdesc, require_explicit=True
                 )
-                is_critical_wip = is_critical(wtags) and not is_held(wtags)
+                wtset = tag_set(wtags)
+                is_critical_wip = is_critical(wtset) and not is_held(wtset)
                 spawn_allowed = MISSING_WORKER_POLICY == "spawn" or is_critical_wip
                 label = "critical WIP" if is_critical_wip else "WIP"
                 spawned = False
@@ -4067,7 +4684,7 @@ def main() -> int:
                         actions.append(f"Would spawn worker for {label} #{wid} ({wtitle})")
                         if not WORKER_SPAWN_CMD:
                             actions.append(f"Would pause {label} #{wid} ({wtitle}) -> Paused (missing worker handle)")
-                            paused_missing_worker_ids.append(wid)
+                            paused_missing_worker_ids.add(wid)
                         budget -= 1
                         continue
                     ok, reason = ensure_worker_handle_for_task(wid, repo_key, repo_path)
@@ -4089,7 +4706,7 @@ def main() -> int:
                     reason = "missing worker handle + repo mapping"
                 if pause_missing_worker(wid, wsl_id, wtitle, reason, label=label):
                     budget -= 1
-                paused_missing_worker_ids.append(wid)
+                paused_missing_worker_ids.add(wid)
                 if budget <= 0:
                     break
 
@@ -4191,9 +4808,10 @@ def main() -> int:
                     ttags = get_task_tags(tid)
                 except Exception:
                     ttags = []
-                if has_tag(ttags, TAG_HOLD_QUEUED_CRITICAL):
+                ttset = tag_set(ttags)
+                if TAG_HOLD_QUEUED_CRITICAL in ttset:
                     continue
-                if is_held(ttags):
+                if is_held(ttset):
                     continue
                 if dry_run:
                     actions.append(f"Would tag queued critical #{tid} ({ttitle}) as hold:queued-critical")
@@ -4225,7 +4843,7 @@ def main() -> int:
 
             # Auto-heal provider blocks: if a card was auto-blocked due to auth/quota
             # and the provider is healthy again, clear the blocked tags so review can resume.
-            lower_rt = {t.lower() for t in (rtags or [])}
+            lower_rt = tag_set(rtags or [])
             if TAG_AUTO_BLOCKED in lower_rt and (TAG_BLOCKED_AUTH in lower_rt or TAG_BLOCKED_QUOTA in lower_rt):
                 provider = infer_preflight_provider("reviewer", REVIEWER_SPAWN_CMD) if REVIEWER_SPAWN_CMD else "claude"
                 if provider:
@@ -4240,16 +4858,17 @@ def main() -> int:
                             except Exception:
                                 rtags = [t for t in rtags if str(t).lower() not in (TAG_AUTO_BLOCKED, TAG_BLOCKED_AUTH, TAG_BLOCKED_QUOTA)]
 
-            if is_held(rtags):
+            rtset = tag_set(rtags)
+            if is_held(rtset):
                 continue
-            if has_tag(rtags, TAG_REVIEW_SKIP):
+            if TAG_REVIEW_SKIP in rtset:
                 continue
 
             patch_path = resolve_patch_path_for_task(rid)
             current_revision = compute_patch_revision(patch_path)
             stored_result = review_results_by_task.get(str(rid))
             stored_revision = extract_review_revision(stored_result)
-            rerun_requested = has_tag(rtags, TAG_REVIEW_RERUN) or has_tag(rtags, TAG_REVIEW_RETRY)
+            rerun_requested = TAG_REVIEW_RERUN in rtset or TAG_REVIEW_RETRY in rtset
             stored_matches = review_revision_matches(current_revision, stored_revision)
 
             stale_result = stored_result is not None and (rerun_requested or not stored_matches)
@@ -4365,7 +4984,7 @@ def main() -> int:
             # If the reviewer is broken (auth/quota) we mark review:error and only retry
             # when a human explicitly asks (review:rerun) to avoid infinite loops.
             # Still allow consuming an already-written result_payload to unblock the pipeline.
-            if has_tag(rtags, TAG_REVIEW_ERROR) and not rerun_requested and not stored_result and not result_payload:
+            if TAG_REVIEW_ERROR in rtset and not rerun_requested and not stored_result and not result_payload:
                 # ensure we don't leave it stuck "inflight"
                 if not dry_run:
                     remove_tags(rid, [TAG_REVIEW_INFLIGHT, TAG_REVIEW_PENDING])
@@ -4407,14 +5026,7 @@ def main() -> int:
                                     errors=errors,
                                 )
                                 reason_tag = TAG_BLOCKED_QUOTA if category == "quota" else TAG_BLOCKED_AUTH
-                                try:
-                                    existing = get_task_tags(rid)
-                                except Exception:
-                                    existing = []
-                                lower = {t.lower() for t in (existing or [])}
-                                if reason_tag.lower() not in lower or TAG_AUTO_BLOCKED.lower() not in lower:
-                                    add_tags(rid, [reason_tag, TAG_AUTO_BLOCKED])
-                                    record_action(rid)
+                                tag_auto_blocked(rid, reason_tag)
 
                             add_tag(rid, TAG_REVIEW_ERROR)
                             remove_tags(rid, [TAG_REVIEW_INFLIGHT, TAG_REVIEW_PENDING])
@@ -4438,7 +5050,7 @@ def main() -> int:
                     actions.append(f"Would spawn reviewer for Review #{rid} ({rtitle})")
                 else:
                     # Mark this Review card as auto-reviewed by default.
-                    if not has_tag(rtags, TAG_REVIEW_AUTO):
+                    if TAG_REVIEW_AUTO not in rtset:
                         add_tag(rid, TAG_REVIEW_AUTO)
                     add_tag(rid, TAG_REVIEW_PENDING)
                     remove_tag(rid, TAG_REVIEW_ERROR)
@@ -4474,7 +5086,7 @@ def main() -> int:
                             new_tags.append(str(t))
                         if TAG_REVIEW_INFLIGHT.lower() not in seen:
                             new_tags.append(TAG_REVIEW_INFLIGHT)
-                        set_task_tags(pid, rid, new_tags)
+                        queue_task_tags(rid, new_tags)
                         actions.append(f"Spawned reviewer for Review #{rid} ({rtitle})")
                     else:
                         # Provider preflight failures are global and should not escalate per-card to review:error.
@@ -4691,11 +5303,11 @@ def main() -> int:
 
                     # Auto-advance Review -> Documentation (preferred) or -> Done on pass (configurable).
                     if REVIEW_AUTO_DONE and budget > 0:
-                        if col_docs is not None:
+                        if docs_column_id is not None:
                             if dry_run:
                                 actions.append(f"Would move Review #{rid} ({rtitle}) -> Documentation (review pass)")
                             else:
-                                move_task(pid, rid, int(col_docs["id"]), 1, int(rsl_id))
+                                move_task(pid, rid, docs_column_id, 1, int(rsl_id))
                                 record_action(rid)
                                 # Docs flow tags are orchestrator-owned. Clear any stale docs state and mark pending.
                                 remove_tags(rid, [TAG_DOC_COMPLETED, TAG_DOC_SKIP, TAG_DOC_INFLIGHT])
@@ -4705,7 +5317,7 @@ def main() -> int:
                             if dry_run:
                                 actions.append(f"Would move Review #{rid} ({rtitle}) -> Done (review pass)")
                             else:
-                                move_task(pid, rid, int(col_done["id"]), 1, int(rsl_id))
+                                move_task(pid, rid, done_column_id, 1, int(rsl_id))
                                 record_action(rid)
                                 actions.append(f"Moved Review #{rid} ({rtitle}) -> Done (review pass)")
                         budget -= 1
@@ -4721,10 +5333,11 @@ def main() -> int:
                     rtags = get_task_tags(rid)
                 except Exception:
                     rtags = []
-                is_critical_review = is_critical(rtags)
+                rtset = tag_set(rtags)
+                is_critical_review = is_critical(rtset)
                 if wip_active_count() >= WIP_LIMIT and not is_critical_review:
                     # Can't move yet; mark it so we keep prioritizing it.
-                    if not has_tag(rtags, TAG_REVIEW_BLOCKED_WIP):
+                    if TAG_REVIEW_BLOCKED_WIP not in rtset:
                         if dry_run:
                             actions.append(f"Would tag Review #{rid} as review:blocked:wip (waiting for WIP capacity)")
                         else:
@@ -4735,7 +5348,7 @@ def main() -> int:
                     if rid != int(active_critical_id):
                         continue
                 rtitle = task_title(rt)
-                if is_held(rtags):
+                if is_held(rtset):
                     continue
 
                 # Thrash guard: if the same patch revision keeps re-failing review, stop looping.
@@ -4815,7 +5428,7 @@ def main() -> int:
                     hist.append(entry)
                     review_rework_history_by_task[str(rid)] = hist
 
-                    move_task(pid, rid, int(col_wip["id"]), 1, int(rsl_id))
+                    move_task(pid, rid, wip_column_id, 1, int(rsl_id))
                     record_action(rid)
                     remove_tags(rid, [TAG_REVIEW_BLOCKED_WIP, TAG_REVIEW_PASS, TAG_REVIEW_PENDING, TAG_REVIEW_INFLIGHT])
                     # Keep review:rework tag as a breadcrumb is optional; for now we clear it once it re-enters WIP.
@@ -4842,7 +5455,7 @@ def main() -> int:
         # - docs:pending is the default state when a card enters Documentation.
         # - docs:inflight is optional/human-driven (used as a signal that docs work started).
         # - docs:completed (or docs:skip) is the gate to Done.
-        if col_docs is not None and budget > 0 and docs_tasks:
+        if docs_column_id is not None and budget > 0 and docs_tasks:
             active_critical_id = None
             if active_critical is not None:
                 try:
@@ -4866,7 +5479,7 @@ def main() -> int:
                 except Exception:
                     dtags = []
 
-                lower = {t.lower() for t in (dtags or [])}
+                lower = tag_set(dtags or [])
 
                 # Auto-heal provider blocks: if a card was auto-blocked due to auth/quota
                 # and the provider is healthy again, clear the blocked tags so docs can resume.
@@ -4883,9 +5496,9 @@ def main() -> int:
                                     dtags = get_task_tags(did)
                                 except Exception:
                                     dtags = [t for t in dtags if str(t).lower() not in (TAG_AUTO_BLOCKED, TAG_BLOCKED_AUTH, TAG_BLOCKED_QUOTA)]
-                                lower = {t.lower() for t in (dtags or [])}
+                                lower = tag_set(dtags or [])
 
-                if is_held(dtags):
+                if is_held(lower):
                     continue
                 done_ready = (TAG_DOC_COMPLETED in lower) or (TAG_DOC_SKIP in lower)
                 retry_requested = TAG_DOC_RETRY in lower
@@ -4903,14 +5516,14 @@ def main() -> int:
                             dtags = get_task_tags(did)
                         except Exception:
                             dtags = list(dtags)
-                        lower = {t.lower() for t in (dtags or [])}
+                        lower = tag_set(dtags or [])
                         done_ready = (TAG_DOC_COMPLETED in lower) or (TAG_DOC_SKIP in lower)
 
                 if done_ready:
                     if dry_run:
                         actions.append(f"Would move Documentation #{did} ({dtitle}) -> Done (docs complete)")
                     else:
-                        move_task(pid, did, int(col_done["id"]), 1, int(dsl_id))
+                        move_task(pid, did, done_column_id, 1, int(dsl_id))
                         record_action(did)
                         # Keep docs:completed/docs:skip as a durable breadcrumb; clear transitional tags.
                         remove_tags(did, [TAG_DOC_PENDING, TAG_DOC_INFLIGHT])
@@ -5049,7 +5662,7 @@ def main() -> int:
                         comment_text = read_text(comment_path, 20000).strip()
                         if comment_text:
                             add_comment(did, comment_text)
-                        move_task(pid, did, int(col_done["id"]), 1, int(dsl_id))
+                        move_task(pid, did, done_column_id, 1, int(dsl_id))
                         record_action(did)
                         docs_workers_by_task.pop(str(did), None)
                         docs_workers_by_task.pop(did, None)
@@ -5157,7 +5770,7 @@ def main() -> int:
                                 new_tags.append(TAG_DOC_AUTO)
                             if TAG_DOC_INFLIGHT.lower() not in seen:
                                 new_tags.append(TAG_DOC_INFLIGHT)
-                            set_task_tags(pid, did, new_tags)
+                            queue_task_tags(did, new_tags)
                             record_action(did)
                             actions.append(f"Spawned docs worker for Documentation #{did} ({dtitle})")
                         else:
@@ -5206,6 +5819,39 @@ def main() -> int:
                         actions.append(f"Tagged Documentation #{did} ({dtitle}) as docs:pending")
                     budget -= 1
 
+        def finish_tick(persist: bool = True, notify: bool = False) -> int:
+            # Single exit path for the early returns and the normal end of a run: write queued tags,
+            # persist state, then report. Flushing first means a failed tag write shows up in errors
+            # rather than silently contradicting a "Tagged ..." action.
+            # Early exits in dry-run pass persist=False: nothing was applied, so skip the state write.
+            errors.extend(flush_task_tags(pid))
+            if notify:
+                # Best-effort human notification (no impact on orchestration decisions).
+                maybe_notify(state, actions=actions, errors=errors)
+            if persist:
+                state["lastActionsByTaskId"] = last_actions
+                state["repoByTaskId"] = repo_by_task
+                state["workersByTaskId"] = workers_by_task
+                state["autoBlockedByOrchestrator"] = auto_blocked
+                state["repoHoldCommentedByTaskId"] = repo_hold_commented_by_task_id
+                state["reviewersByTaskId"] = reviewers_by_task
+                state["reviewResultsByTaskId"] = review_results_by_task
+                state["reviewReworkHistoryByTaskId"] = review_rework_history_by_task
+                state["reviewerSpawnFailuresByTaskId"] = reviewer_spawn_failures_by_task
+                state["docsWorkersByTaskId"] = docs_workers_by_task
+                state["docsSpawnFailuresByTaskId"] = docs_spawn_failures_by_task
+                state["docsTimeoutRestartsByTaskId"] = docs_timeout_restarts_by_task
+                save_state(state)
+            emit_json(
+                mode=mode,
+                actions=actions,
+                promoted_to_ready=promoted_to_ready,
+                moved_to_wip=moved_to_wip,
+                created_tasks=created_tasks,
+                errors=errors,
+            )
+            return 0
+
         # Resume tasks paused by a prior critical when the critical no longer enforces exclusivity.
         paused_by_critical: Dict[str, Any] = state.get("pausedByCritical") or {}
 
@@ -5215,7 +5861,7 @@ def main() -> int:
 
             # Clear paused:critical tags when no critical remains.
             def paused_reason_tags(tags: list[str]) -> set[str]:
-                lower = {t.lower() for t in tags}
+                lower = tag_set(tags)
                 return {t for t in lower if t.startswith('paused:')}
 
             for tid_s, info in list(paused_by_critical.items()):
@@ -5233,7 +5879,7 @@ def main() -> int:
                         tags = get_task_tags(tid)
                     except Exception:
                         tags = []
-                    lower = {t.lower() for t in tags}
+                    lower = tag_set(tags)
                     # Always remove the critical reason tag.
                     if TAG_PAUSED_CRITICAL in lower:
                         remove_tag(tid, TAG_PAUSED_CRITICAL)
@@ -5244,11 +5890,11 @@ def main() -> int:
                     except Exception:
                         tags2 = []
                     reasons = paused_reason_tags(tags2)
-                    if added_paused and (not reasons) and (TAG_PAUSED in {t.lower() for t in tags2}):
+                    if added_paused and (not reasons) and (TAG_PAUSED in tag_set(tags2)):
                         remove_tag(tid, TAG_PAUSED)
                     record_action(tid)
                     actions.append(f'Cleared paused:critical for #{tid} (critical cleared)')
-                    paused_by_critical.pop(str(tid), None)
+                    paused_by_critical.pop(tid_s, None)
                     cleared_any = True
                 budget -= 1
             if cleared_any:
@@ -5261,14 +5907,14 @@ def main() -> int:
             cid = int(ct.get("id"))
             ctitle = task_title(ct)
 
-            critical_in_wip = int(c_col_id) == int(col_wip["id"])
-            critical_in_review = int(c_col_id) == int(col_review["id"])
-            critical_in_docs = bool(col_docs is not None and int(c_col_id) == int(col_docs["id"]))
+            critical_in_wip = int(c_col_id) == wip_column_id
+            critical_in_review = int(c_col_id) == review_column_id
+            critical_in_docs = int(c_col_id) == docs_column_id
 
             def pause_noncritical_wip() -> None:
                 nonlocal budget
                 budget = max(budget, ACTION_BUDGET_CRITICAL)
-                current_wip = sorted(tasks_for_column(int(col_wip['id'])), key=sort_key)
+                current_wip = sorted(tasks_for_column(wip_column_id), key=sort_key)
                 paused_state = state.get('pausedByCritical') or {}
                 wip_by_id = {int(t.get('id')): (t, sl_id) for t, sl_id in current_wip}
                 pause_ids = plan_pause_wip(
@@ -5292,7 +5938,7 @@ def main() -> int:
                         existing_tags = get_task_tags(wid)
                     except Exception:
                         existing_tags = []
-                    lower = {t.lower() for t in existing_tags}
+                    lower = tag_set(existing_tags)
                     added_paused = TAG_PAUSED not in lower
                     add_tags(wid, [TAG_PAUSED, TAG_PAUSED_CRITICAL])
                     record_action(wid)
@@ -5306,6 +5952,7 @@ def main() -> int:
                     budget -= 1
 
                 state['pausedByCritical'] = paused_state
+                invalidate_wip_active_count()
 
             # While a critical is active (and freeze is enabled), keep other WIP cards paused.
             if critical_exclusive:
@@ -5406,11 +6053,10 @@ def main() -> int:
                                 continue
                             wtags = get_task_tags(wid)
                             wdesc = (get_task(wid).get("description") or "")
-                            for k in parse_exclusive_keys(wtags, wdesc):
-                                critical_wip_exclusive_keys.add(k)
+                            critical_wip_exclusive_keys.update(parse_exclusive_keys(wtags, wdesc))
 
                         ex_keys = parse_exclusive_keys(ctags, desc)
-                        ex_conflicts = [k for k in ex_keys if k in critical_wip_exclusive_keys]
+                        ex_conflicts = sorted(critical_wip_exclusive_keys.intersection(ex_keys))
 
                         if ex_conflicts:
                             errors.append(
@@ -5454,9 +6100,10 @@ def main() -> int:
                                                 TAG_HOLD_NEEDS_REPO,
                                             ],
                                         )
-                                        move_task(pid, cid, int(col_wip["id"]), 1, int(csl_id))
+                                        move_task(pid, cid, wip_column_id, 1, int(csl_id))
                                         record_action(cid)
                                         moved_to_wip.append(cid)
+                                        invalidate_wip_active_count()
                                         actions.append(f"Started critical #{cid} ({ctitle}) -> WIP")
                                         critical_exclusive = True
                                     else:
@@ -5485,27 +6132,7 @@ def main() -> int:
 
             # While a critical is actively in WIP, freeze normal pulling.
             if critical_exclusive:
-                state["lastActionsByTaskId"] = last_actions
-                state["repoByTaskId"] = repo_by_task
-                state["workersByTaskId"] = workers_by_task
-                state["autoBlockedByOrchestrator"] = auto_blocked
-                state["reviewersByTaskId"] = reviewers_by_task
-                state["reviewResultsByTaskId"] = review_results_by_task
-                state["reviewReworkHistoryByTaskId"] = review_rework_history_by_task
-                state["reviewerSpawnFailuresByTaskId"] = reviewer_spawn_failures_by_task
-                state["docsWorkersByTaskId"] = docs_workers_by_task
-                state["docsSpawnFailuresByTaskId"] = docs_spawn_failures_by_task
-                save_state(state)
-
-                emit_json(
-                    mode=mode,
-                    actions=actions,
-                    promoted_to_ready=promoted_to_ready,
-                    moved_to_wip=moved_to_wip,
-                    created_tasks=created_tasks,
-                    errors=errors,
-                )
-                return 0
+                return finish_tick(persist=not dry_run)
 
         # ---------------------------------------------------------------------
         # NORMAL MODE
@@ -5515,31 +6142,20 @@ def main() -> int:
         active_wip = wip_active_count()
         if active_wip > WIP_LIMIT:
             actions.append(f"WIP active is {active_wip} (> {WIP_LIMIT}); not pulling new work")
-            state["lastActionsByTaskId"] = last_actions
-            state["repoByTaskId"] = repo_by_task
-            state["workersByTaskId"] = workers_by_task
-            state["autoBlockedByOrchestrator"] = auto_blocked
-            state["reviewersByTaskId"] = reviewers_by_task
-            state["reviewResultsByTaskId"] = review_results_by_task
-            state["reviewReworkHistoryByTaskId"] = review_rework_history_by_task
-            state["reviewerSpawnFailuresByTaskId"] = reviewer_spawn_failures_by_task
-            state["docsWorkersByTaskId"] = docs_workers_by_task
-            state["docsSpawnFailuresByTaskId"] = docs_spawn_failures_by_task
-            state["docsTimeoutRestartsByTaskId"] = docs_timeout_restarts_by_task
-            save_state(state)
-            emit_json(
-                mode=mode,
-                actions=actions,
-                promoted_to_ready=promoted_to_ready,
-                moved_to_wip=moved_to_wip,
-                created_tasks=created_tasks,
-                errors=errors,
-            )
-            return 0
+            return finish_tick(persist=not dry_run)
 
         # Helper: pick top ready/backlog
-        ready_tasks_sorted = sorted(ready_tasks, key=sort_key)
-        backlog_sorted = sorted(backlog_tasks, key=sort_key)
+        # Ready is consumed from the front (and re-fronted on promotion); keep it as a deque of
+        # (task, swimlane_id, task_id, title) so the id/title are derived once per card.
+        # The board is fetched once per run, so these queues are the run's working copy: cards are
+        # removed as they are handled rather than re-derived from the (unchanged) board snapshot.
+        ready_tasks_sorted: collections.deque[Tuple[Dict[str, Any], int, int, str]] = collections.deque(
+            (t, sid, int(t.get("id")), task_title(t)) for t, sid in sorted(ready_tasks, key=sort_key)
+        )
+        # Backlog is keyed by task id (in sort order) so promotions can drop an entry in O(1).
+        backlog_by_id: Dict[int, Tuple[Dict[str, Any], int]] = collections.OrderedDict(
+            (int(t.get("id")), (t, sid)) for t, sid in sorted(backlog_tasks, key=sort_key)
+        )
 
         # Selection: treat epic containers as non-actionable; skip them and pull the next real task.
         # Also enforce:
@@ -5559,50 +6175,46 @@ def main() -> int:
             epic: Optional[Dict[str, Any]] = None
             blocked: Optional[Tuple[Dict[str, Any], int, str]] = None
 
-            # precompute exclusive keys currently in WIP
-            wip_exclusive_keys: set[str] = set()
-            for wt, _wsl in wip_tasks:
-                wid = int(wt.get('id'))
-                wtags = get_task_tags(wid)
-                if is_held(wtags):
+            for tid, (t, sl_id) in backlog_by_id.items():
+                if tid in backlog_passed_ids:
                     continue
-                wdesc = (get_task(wid).get('description') or '')
-                for k in parse_exclusive_keys(wtags, wdesc):
-                    wip_exclusive_keys.add(k)
-
-            for t, sl_id in backlog_sorted:
-                tid = int(t.get("id"))
                 tags = get_task_tags(tid)
                 title = task_title(t)
 
-                if is_held(tags):
+                tset = tag_set(tags)
+                if is_held(tset):
+                    backlog_passed_ids.add(tid)
                     continue
 
-                if is_epic(tags) or title.lower().startswith("epic:"):
+                if is_epic(tset) or title.lower().startswith("epic:"):
                     if epic is None:
                         epic = t
                     continue
 
                 # Cooldown: don't keep re-moving the same backlog item across runs.
                 if not cooled(tid):
+                    backlog_passed_ids.add(tid)
                     continue
 
-                full = get_task(tid)
-                desc = (full.get('description') or '')
+                desc = task_description(t)
 
                 # deps
                 deps = parse_depends_on(desc)
-                unmet = [d for d in deps if not is_done(d)]
-                if unmet:
-                    if blocked is None:
+                if blocked is None:
+                    unmet = [d for d in deps if not is_done(d)]
+                    if unmet:
                         blocked = (t, sl_id, f"Depends on {', '.join('#'+str(x) for x in unmet)}")
+                        continue
+                elif not all(is_done(d) for d in deps):
+                    # The blocked candidate is already chosen; only pickability matters now.
                     continue
 
                 # exclusive
                 ex_keys = parse_exclusive_keys(tags, desc)
-                if any(k in wip_exclusive_keys for k in ex_keys):
+                ex_conflicts = active_wip_exclusive_keys.intersection(ex_keys)
+                if ex_conflicts:
                     if blocked is None:
-                        blocked = (t, sl_id, f"Exclusive conflict: {', '.join('exclusive:'+k for k in ex_keys if k in wip_exclusive_keys)}")
+                        blocked = (t, sl_id, f"Exclusive conflict: {', '.join('exclusive:'+k for k in sorted(ex_conflicts))}")
                     continue
 
                 # repo mapping (required for auto-start)
@@ -5619,14 +6231,85 @@ def main() -> int:
         # Desired behavior:
         # - Keep Ready filled when possible (even if WIP is already full).
         # - Start work immediately when WIP has capacity.
-        # Precompute exclusive keys currently in WIP (real board state)
+        # Exclusive keys currently in WIP (real board state), computed once and kept current as cards
+        # start below. The Ready -> WIP dispatcher respects every WIP card; Backlog selection
+        # (pick_next_backlog_action) ignores held WIP cards since they aren't progressing.
         wip_exclusive_keys: set[str] = set()
+        active_wip_exclusive_keys: set[str] = set()
         for wt, _wsl in wip_tasks:
             wid = int(wt.get('id'))
             wtags = get_task_tags(wid)
             wdesc = (get_task(wid).get('description') or '')
-            for k in parse_exclusive_keys(wtags, wdesc):
-                wip_exclusive_keys.add(k)
+            wkeys = parse_exclusive_keys(wtags, wdesc)
+            wip_exclusive_keys.update(wkeys)
+            if not is_held(wtags):
+                active_wip_exclusive_keys.update(wkeys)
+
+        # Backlog cards pick_next_backlog_action() passed over as held or cooling down. Held tags are only
+        # added during the loop and cooldown reads the start-of-run snapshot, so they stay passed over.
+        backlog_passed_ids: set[int] = set()
+        # Ready cards already decided this run (held, blocked, cooling down, exclusive conflict, started).
+        # None of those can change within a run, so a later visit just drops them.
+        ready_skip_ids: set[int] = set()
+        # Cards dropped from the queue but still sitting in Ready (cooldown, exclusive conflict). The
+        # "Ready is empty" gates must still see them, or Backlog gets promoted around a stuck card.
+        ready_parked_ids: set[int] = set()
+
+        def ready_is_empty() -> bool:
+            return not ready_tasks_sorted and not ready_parked_ids
+        # Only auto-blocked Blocked cards can auto-heal. The loop never tags cards in Blocked, so filter once
+        # here instead of re-reading every Blocked card's tags on each pass.
+        auto_heal_blocked: List[Tuple[Dict[str, Any], int]] = []
+        for bt, bsl_id in sorted(blocked_tasks, key=sort_key):
+            try:
+                btags = tag_set(get_task_tags(int(bt.get("id"))))
+            except Exception:
+                continue
+            if has_tag(btags, TAG_AUTO_BLOCKED) and not is_held(btags):
+                auto_heal_blocked.append((bt, bsl_id))
+        # Blocked cards auto-healed (or, in dry-run, that would have been) this run.
+        healed_blocked_ids: set[int] = set()
+        # Title -> task id across the board, built on first epic breakdown check.
+        title_to_id: Optional[Dict[str, int]] = None
+
+        def check_ready_candidate(cid: int, ctitle: str) -> Tuple[str, Any]:
+            """Decide what to do with the Ready card at the head of the queue.
+
+            Returns (decision, detail):
+            - ("skip", None): held; drop it from the queue silently.
+            - ("rotate", action): keep it in Ready (cooldown / exclusive conflict); detail is the action line.
+            - ("block", (reason, tag)): send it back to Backlog tagged with the block reason.
+            - ("start", (exclusive_keys, repo_key, repo_path)): eligible to start a worker.
+            """
+            tags = get_task_tags(cid)
+            if is_held(tags):
+                return "skip", None
+
+            desc = (get_task(cid).get("description") or "")
+            unmet = [d for d in parse_depends_on(desc) if not is_done(d)]
+            if unmet:
+                if not cooled(cid):
+                    return "rotate", f"Skipped Ready #{cid} ({ctitle}) -> Backlog due to cooldown; leaving in Ready"
+                return "block", ("Depends on " + ", ".join("#" + str(x) for x in unmet), TAG_BLOCKED_DEPS)
+
+            ex_keys = parse_exclusive_keys(tags, desc)
+            ex_conflicts = wip_exclusive_keys.intersection(ex_keys)
+            if ex_conflicts:
+                return (
+                    "rotate",
+                    f"Skipped Ready #{cid} ({ctitle}) due to exclusive conflict: "
+                    f"{', '.join('exclusive:' + k for k in sorted(ex_conflicts))}",
+                )
+
+            repo_ok, repo_key, repo_path, _source = resolve_repo_for_task(
+                cid, ctitle, tags, desc, require_explicit=True
+            )
+            if not repo_ok:
+                if not cooled(cid):
+                    return "rotate", f"Skipped Ready #{cid} ({ctitle}) -> Backlog due to cooldown; leaving in Ready"
+                return "block", ("No repo mapping", TAG_BLOCKED_REPO)
+
+            return "start", (ex_keys, repo_key, repo_path)
 
         while budget > 0:
             did_something = False
@@ -5634,15 +6317,14 @@ def main() -> int:
             # 0) Auto-heal Backlog tasks that were auto-blocked and are now clear.
             # (e.g. deps resolved, exclusives released, repo mapping added.)
             # Only do this when Ready is empty to avoid thrash.
-            if budget > 0 and not ready_tasks_sorted and backlog_sorted:
-                for bt, bsl_id in backlog_sorted:
-                    bid = int(bt.get("id"))
+            if budget > 0 and ready_is_empty() and backlog_by_id:
+                for bid, (bt, bsl_id) in backlog_by_id.items():
                     btitle = task_title(bt)
                     try:
                         btags = get_task_tags(bid)
                     except Exception:
                         btags = []
-                    lower = {t.lower() for t in btags}
+                    lower = tag_set(btags)
                     if TAG_AUTO_BLOCKED not in lower:
                         continue
                     # Only auto-heal for the transient blocked reasons.
@@ -5652,8 +6334,7 @@ def main() -> int:
                         continue
 
                     try:
-                        full = get_task(bid)
-                        desc = (full.get("description") or "")
+                        desc = task_description(bt)
                     except Exception:
                         desc = ""
 
@@ -5665,7 +6346,7 @@ def main() -> int:
 
                     # exclusive
                     ex_keys = parse_exclusive_keys(btags, desc)
-                    if any(k in wip_exclusive_keys for k in ex_keys):
+                    if not wip_exclusive_keys.isdisjoint(ex_keys):
                         continue
 
                     # repo mapping
@@ -5675,7 +6356,7 @@ def main() -> int:
                     if dry_run:
                         actions.append(f"Would auto-heal Backlog #{bid} ({btitle}) -> Ready")
                     else:
-                        move_task(pid, bid, int(col_ready["id"]), 1, bsl_id)
+                        move_task(pid, bid, ready_column_id, 1, bsl_id)
                         record_action(bid)
                         promoted_to_ready.append(bid)
                         remove_tags(
@@ -5693,30 +6374,25 @@ def main() -> int:
                         actions.append(f"Auto-healed Backlog #{bid} ({btitle}) -> Ready")
                     budget -= 1
                     did_something = True
-                    ready_tasks_sorted = sorted(tasks_for_column(int(col_ready["id"])), key=sort_key)
-                    backlog_sorted = sorted(tasks_for_column(int(col_backlog["id"])), key=sort_key)
+                    backlog_by_id.pop(bid, None)
                     break
 
             # 0) Auto-heal Blocked tasks that were auto-blocked and are now clear.
             # Only do this when Ready is empty to avoid thrash.
-            if budget > 0 and not ready_tasks_sorted and blocked_tasks:
-                blocked_sorted = sorted(tasks_for_column(int(col_blocked["id"])), key=sort_key)
-                for bt, bsl_id in blocked_sorted:
+            if budget > 0 and ready_is_empty() and auto_heal_blocked:
+                for bt, bsl_id in auto_heal_blocked:
                     bid = int(bt.get("id"))
+                    if bid in healed_blocked_ids:
+                        continue
                     btitle = task_title(bt)
                     try:
                         btags = get_task_tags(bid)
                     except Exception:
                         btags = []
-                    if is_held(btags):
-                        continue
-                    if not has_tag(btags, TAG_AUTO_BLOCKED):
-                        continue
                     if not cooled(bid):
                         continue
                     try:
-                        full = get_task(bid)
-                        desc = (full.get("description") or "")
+                        desc = task_description(bt)
                     except Exception:
                         desc = ""
 
@@ -5726,7 +6402,7 @@ def main() -> int:
                         continue
 
                     ex_keys = parse_exclusive_keys(btags, desc)
-                    if any(k in wip_exclusive_keys for k in ex_keys):
+                    if not wip_exclusive_keys.isdisjoint(ex_keys):
                         continue
 
                     if not has_repo_mapping(bid, btitle, btags, desc):
@@ -5735,7 +6411,7 @@ def main() -> int:
                     if dry_run:
                         actions.append(f"Would auto-heal Blocked #{bid} ({btitle}) -> Ready")
                     else:
-                        move_task(pid, bid, int(col_ready["id"]), 1, bsl_id)
+                        move_task(pid, bid, ready_column_id, 1, bsl_id)
                         record_action(bid)
                         promoted_to_ready.append(bid)
                         remove_tags(
@@ -5753,13 +6429,11 @@ def main() -> int:
                         actions.append(f"Auto-healed Blocked #{bid} ({btitle}) -> Ready")
                     budget -= 1
                     did_something = True
-                    # refresh lists
-                    ready_tasks_sorted = sorted(tasks_for_column(int(col_ready["id"])), key=sort_key)
-                    backlog_sorted = sorted(tasks_for_column(int(col_backlog["id"])), key=sort_key)
+                    healed_blocked_ids.add(bid)
                     break
 
             # 1) If Ready is empty and Backlog has work, promote one item to Ready.
-            if not ready_tasks_sorted and backlog_sorted:
+            if ready_is_empty() and backlog_by_id:
                 picked, epic_container, blocked_candidate = pick_next_backlog_action()
 
                 # If the next candidate is blocked by deps/exclusive/repo, move it to Blocked with a clear reason.
@@ -5790,9 +6464,8 @@ def main() -> int:
                         )
                     budget -= 1
                     did_something = True
-                    # simulate state / refresh sorted lists next loop
-                    backlog_sorted = [(t, sid) for (t, sid) in backlog_sorted if int(t.get("id")) != bid]
-                    ready_tasks_sorted = sorted(tasks_for_column(int(col_ready["id"])), key=sort_key)
+                    # simulate state
+                    backlog_by_id.pop(bid, None)
                     continue
 
                 if picked is not None:
@@ -5802,13 +6475,13 @@ def main() -> int:
                     if dry_run:
                         actions.append(f"Would promote Backlog #{cid} ({ctitle}) -> Ready")
                     else:
-                        move_task(pid, cid, int(col_ready["id"]), 1, sl_id)
+                        move_task(pid, cid, ready_column_id, 1, sl_id)
                         record_action(cid)
                         promoted_to_ready.append(cid)
                         actions.append(f"Promoted Backlog #{cid} ({ctitle}) -> Ready")
                     # simulate state
-                    backlog_sorted = [(t, sid) for (t, sid) in backlog_sorted if int(t.get("id")) != cid]
-                    ready_tasks_sorted = [(candidate, sl_id)] + ready_tasks_sorted
+                    backlog_by_id.pop(cid, None)
+                    ready_tasks_sorted.appendleft((candidate, sl_id, cid, ctitle))
                     budget -= 1
                     did_something = True
 
@@ -5819,14 +6492,11 @@ def main() -> int:
                     bt = breakdown_title(eid, etitle)
 
                     # Search for existing breakdown anywhere (including Done) to avoid duplicates
-                    all_tasks = (
-                        backlog_tasks
-                        + ready_tasks
-                        + wip_tasks
-                        + tasks_for_column(int(col_review["id"]))
-                        + tasks_for_column(int(col_done["id"]))
-                    )
-                    existing = find_existing_breakdown(all_tasks, bt)
+                    if title_to_id is None:
+                        title_to_id = index_task_titles(
+                            itertools.chain(backlog_tasks, ready_tasks, wip_tasks, review_tasks, done_tasks)
+                        )
+                    existing = title_to_id.get(bt)
 
                     if existing:
                         if dry_run:
@@ -5841,98 +6511,58 @@ def main() -> int:
                                 pid,
                                 bt,
                                 f"Breakdown for epic #{eid}: {etitle}\n\nEpic: #{eid}",
-                                int(col_backlog["id"]),
+                                backlog_column_id,
                             )
                             set_task_tags(pid, new_id, [TAG_STORY, TAG_EPIC_CHILD])
                             created_tasks.append(new_id)
+                            title_to_id[bt] = new_id
                             actions.append(f"Created breakdown task #{new_id} for epic #{eid} ({etitle})")
                         budget -= 1
                         did_something = True
 
             # 2) If WIP has capacity and Ready has items, move Ready -> WIP.
             if budget > 0 and wip_active_count() < WIP_LIMIT and ready_tasks_sorted:
-                candidate, sl_id = ready_tasks_sorted[0]
-                cid = int(candidate.get("id"))
-                ctitle = task_title(candidate)
-                tags = get_task_tags(cid)
-
-                if is_held(tags):
-                    # skip held
-                    ready_tasks_sorted = ready_tasks_sorted[1:]
+                candidate, sl_id, cid, ctitle = ready_tasks_sorted[0]
+                if cid in ready_skip_ids:
+                    ready_tasks_sorted.popleft()
                     continue
-
-                full = get_task(cid)
-                desc = (full.get('description') or '')
-                deps = parse_depends_on(desc)
-                unmet = [d for d in deps if not is_done(d)]
-                if unmet:
-                    if not cooled(cid):
-                        actions.append(
-                            f"Skipped Ready #{cid} ({ctitle}) -> Backlog due to cooldown; leaving in Ready"
-                        )
-                        ready_tasks_sorted = ready_tasks_sorted[1:] + [(candidate, sl_id)]
-                        budget -= 1
-                        did_something = True
-                        continue
-                    reason = "Depends on " + ", ".join("#" + str(x) for x in unmet)
-                    if dry_run:
-                        actions.append(f"Would move Ready #{cid} ({ctitle}) -> Backlog; tag {TAG_BLOCKED_DEPS}: {reason}")
-                    else:
-                        tag_blocked_and_keep_in_backlog(
-                            cid,
-                            int(sl_id),
-                            ctitle,
-                            reason,
-                            TAG_BLOCKED_DEPS,
-                            from_label="Ready",
-                            auto_blocked=True,
-                        )
-                    budget -= 1
-                    did_something = True
-                    # simulate / refresh lists
-                    ready_tasks_sorted = ready_tasks_sorted[1:]
+                decision, detail = check_ready_candidate(cid, ctitle)
+                if decision == "skip":
+                    ready_skip_ids.add(cid)
+                    ready_tasks_sorted.popleft()
                     continue
-
-                ex_keys = parse_exclusive_keys(tags, desc)
-                if any(k in wip_exclusive_keys for k in ex_keys):
-                    # exclusive conflict, keep in Ready but don't start
-                    actions.append(
-                        f"Skipped Ready #{cid} ({ctitle}) due to exclusive conflict: {', '.join('exclusive:'+k for k in ex_keys if k in wip_exclusive_keys)}"
-                    )
-                    # move to end of ready queue for now
-                    ready_tasks_sorted = ready_tasks_sorted[1:] + [(candidate, sl_id)]
+                if decision == "rotate":
+                    # Leave it in Ready but don't start. Cooldowns and WIP exclusives can't clear within
+                    # a run, so drop it from this run's queue instead of rotating it to the back.
+                    if REPORT_SKIPS:
+                        actions.append(detail)
+                    ready_skip_ids.add(cid)
+                    ready_parked_ids.add(cid)
+                    ready_tasks_sorted.popleft()
                     budget -= 1
                     did_something = True
                     continue
-
-                repo_ok, repo_key, repo_path, _source = resolve_repo_for_task(
-                    cid, ctitle, tags, desc, require_explicit=True
-                )
-                if not repo_ok:
-                    if not cooled(cid):
-                        actions.append(
-                            f"Skipped Ready #{cid} ({ctitle}) -> Backlog due to cooldown; leaving in Ready"
-                        )
-                        ready_tasks_sorted = ready_tasks_sorted[1:] + [(candidate, sl_id)]
-                        budget -= 1
-                        did_something = True
-                        continue
+                if decision == "block":
+                    reason, reason_tag = detail
                     if dry_run:
-                        actions.append(f"Would move Ready #{cid} ({ctitle}) -> Backlog; tag {TAG_BLOCKED_REPO}: No repo mapping")
+                        actions.append(f"Would move Ready #{cid} ({ctitle}) -> Backlog; tag {reason_tag}: {reason}")
                     else:
                         tag_blocked_and_keep_in_backlog(
                             cid,
                             int(sl_id),
                             ctitle,
-                            "No repo mapping",
-                            TAG_BLOCKED_REPO,
+                            reason,
+                            reason_tag,
                             from_label="Ready",
                             auto_blocked=True,
                         )
                     budget -= 1
                     did_something = True
-                    ready_tasks_sorted = ready_tasks_sorted[1:]
+                    ready_skip_ids.add(cid)
+                    ready_tasks_sorted.popleft()
                     continue
+
+                ex_keys, repo_key, repo_path = detail
                 # Never create silent WIP.
                 # We only move Ready -> WIP when we have (or can spawn) a worker handle immediately.
                 started = False
@@ -5948,7 +6578,7 @@ def main() -> int:
                 else:
                     ok, reason = ensure_worker_handle_for_task(cid, repo_key, repo_path)
                     if ok:
-                        move_task(pid, cid, int(col_wip["id"]), 1, sl_id)
+                        move_task(pid, cid, wip_column_id, 1, sl_id)
                         record_action(cid)
                         moved_to_wip.append(cid)
                         actions.append(f"Moved Ready #{cid} ({ctitle}) -> WIP")
@@ -5968,13 +6598,14 @@ def main() -> int:
                             )
 
                 # simulate state
-                ready_tasks_sorted = ready_tasks_sorted[1:]
+                ready_skip_ids.add(cid)
+                ready_tasks_sorted.popleft()
                 if started:
                     wip_tasks.append((candidate, sl_id))
                     wip_count += 1
-                    invalidate_wip_active_count()
-                    for k in ex_keys:
-                        wip_exclusive_keys.add(k)
+                    note_wip_started()
+                    wip_exclusive_keys.update(ex_keys)
+                    active_wip_exclusive_keys.update(ex_keys)
                 budget -= 1
                 did_something = True
 
@@ -5982,36 +6613,13 @@ def main() -> int:
                 break
 
         # Persist state updates
-        state["lastActionsByTaskId"] = last_actions
-        state["repoByTaskId"] = repo_by_task
-        state["workersByTaskId"] = workers_by_task
-        state["autoBlockedByOrchestrator"] = auto_blocked
-        state["repoHoldCommentedByTaskId"] = repo_hold_commented_by_task_id
-        state["reviewersByTaskId"] = reviewers_by_task
-        state["reviewResultsByTaskId"] = review_results_by_task
-        state["reviewReworkHistoryByTaskId"] = review_rework_history_by_task
-        state["reviewerSpawnFailuresByTaskId"] = reviewer_spawn_failures_by_task
-        state["docsWorkersByTaskId"] = docs_workers_by_task
-        state["docsSpawnFailuresByTaskId"] = docs_spawn_failures_by_task
         if dry_run:
             if dry_runs_remaining > 0:
                 state["dryRunRunsRemaining"] = dry_runs_remaining - 1
                 if state["dryRunRunsRemaining"] <= 0:
                     state["dryRun"] = False
 
-        # Best-effort human notification (no impact on orchestration decisions).
-        maybe_notify(state, actions=actions, errors=errors)
-        save_state(state)
-
-        emit_json(
-            mode=mode,
-            actions=actions,
-            promoted_to_ready=promoted_to_ready,
-            moved_to_wip=moved_to_wip,
-            created_tasks=created_tasks,
-            errors=errors,
-        )
-        return 0
+        return finish_tick(notify=True)
 
     except Exception as e:
         # Always emit something parseable for cron.
@@ -6023,10 +6631,14 @@ def main() -> int:
             "createdTasks": [],
             "errors": [f"RecallDeck board orchestrator error: {e}"],
         }
-        print(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+        write_json_line(payload)
         return 0
 
     finally:
+        # finish_tick() normally flushes queued tag changes; this covers runs that raised before it.
+        if pid is not None:
+            flush_task_tags(pid)
+        close_rpc_connection()
         release_lock(lock)
 
 
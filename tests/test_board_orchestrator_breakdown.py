@@ -0,0 +1,20 @@
+import unittest
+
+from scripts import board_orchestrator as bo
+
+
+class TestBreakdownIndex(unittest.TestCase):
+    def test_index_task_titles_keeps_first_match(self) -> None:
+        bt = bo.breakdown_title(7, "Epic: Search")
+        tasks = [
+            ({"id": 1, "title": "Unrelated"}, 1),
+            ({"id": 2, "title": f"  {bt} "}, 1),
+            ({"id": 3, "title": bt}, 2),
+        ]
+        idx = bo.index_task_titles(tasks)
+        self.assertEqual(idx.get(bt), 2)
+        self.assertIsNone(idx.get(bo.breakdown_title(8, "Epic: Other")))
+
+
+if __name__ == "__main__":
+    unittest.main()
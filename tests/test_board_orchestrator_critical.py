@@ -16,6 +16,12 @@ class TestCriticalHelpers(unittest.TestCase):
 
         self.assertEqual(pause_ids, [1])
 
+    def test_plan_pause_wip_ignores_malformed_state_keys(self) -> None:
+        paused_by_critical = {"3": {"pausedAtMs": 10}, "oops": {"pausedAtMs": 5}}
+
+        self.assertEqual(bo.plan_pause_wip([1, 3], set(), paused_by_critical), [1])
+        self.assertEqual(bo.sorted_paused_ids(paused_by_critical), [3])
+
     def test_plan_resume_from_state_orders_and_respects_wip_limit(self) -> None:
         paused_by_critical = {
             "2": {"pausedAtMs": 200},
@@ -99,6 +105,16 @@ class TestRepoMappingHelpers(unittest.TestCase):
         self.assertEqual(bo.normalize_repo_key(" server "), "server")
         self.assertEqual(bo.normalize_repo_key("Server/API"), "server-api")
 
+    def test_tag_helpers_accept_precomputed_tag_set(self) -> None:
+        tags = ["Critical", "Hold:queued-critical"]
+        tset = bo.tag_set(tags)
+        self.assertEqual(tset, frozenset({"critical", "hold:queued-critical"}))
+        self.assertIs(bo.tag_set(tset), tset)
+        self.assertEqual(bo.is_critical(tset), bo.is_critical(tags))
+        self.assertEqual(bo.is_held(tset), bo.is_held(tags))
+        self.assertEqual(bo.is_hard_hold(tset), bo.is_hard_hold(tags))
+        self.assertTrue(bo.has_tag(tset, "HOLD:QUEUED-CRITICAL"))
+
     def test_discover_repo_map_adds_recalldeck_aliases(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -113,6 +129,20 @@ class TestRepoMappingHelpers(unittest.TestCase):
             self.assertIn("recalldeck-web", m)
             self.assertIn("web", m)
 
+    def test_discover_repo_map_skips_files_and_follows_symlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "repos"
+            root.mkdir()
+            (root / "notes.txt").write_text("x")
+            target = Path(tmp) / "elsewhere"
+            target.mkdir()
+            (root / "Linked").symlink_to(target, target_is_directory=True)
+
+            m = bo.discover_repo_map(str(root))
+
+            self.assertNotIn("notes-txt", m)
+            self.assertEqual(m["linked"], str(root / "Linked"))
+
     def test_load_repo_map_from_file_normalizes_keys(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -164,6 +194,11 @@ class TestRepoMappingHelpers(unittest.TestCase):
             merged = bo.merge_repo_maps({"server": "/does/not/exist"}, {"server": str(server)})
             self.assertEqual(merged["server"], str(server))
 
+    def test_merge_repo_maps_trusts_verified_paths(self) -> None:
+        verified = {"web": "/verified/elsewhere/web"}
+        merged = bo.merge_repo_maps({"api": "/does/not/exist"}, verified, verified=(verified,))
+        self.assertEqual(merged, {"web": "/verified/elsewhere/web"})
+
 
 if __name__ == "__main__":
     unittest.main()
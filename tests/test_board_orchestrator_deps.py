@@ -20,6 +20,22 @@ class TestDependsParsing(unittest.TestCase):
         desc = "Depends on: #30 #31 #32\n"
         self.assertEqual(bo.parse_depends_on(desc), [30, 31, 32])
 
+    def test_directives_parsed_together(self) -> None:
+        desc = "Depends on: #30\nExclusive: db, api\nRepo: foo\n"
+        self.assertEqual(bo.parse_depends_on(desc), [30])
+        self.assertEqual(bo.parse_exclusive_keys([], desc), ["db", "api"])
+        self.assertEqual(bo.parse_description_directives(desc), ("#30", "db, api", "foo"))
+
+    def test_directive_on_line_after_empty_value_still_found(self) -> None:
+        desc = "Depends on:\nexclusive: db\n"
+        self.assertEqual(bo.parse_exclusive_keys([], desc), ["db"])
+
+    def test_description_without_directives(self) -> None:
+        desc = "See https://example.com for the spec.\nNo blockers here.\n"
+        self.assertEqual(bo.parse_description_directives(desc), (None, None, None))
+        self.assertEqual(bo.parse_depends_on(desc), [])
+        self.assertEqual(bo.parse_description_directives("REPO: Foo\n"), (None, None, "Foo"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,6 +20,35 @@ class TestLockStrategy(unittest.TestCase):
                 bo.LOCK_STRATEGY = old_strategy
                 bo.LOCK_PATH = old_path
 
+    def test_legacy_lock_stays_held_while_heartbeat_is_fresh(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            old_strategy = bo.LOCK_STRATEGY
+            old_path = bo.LOCK_PATH
+            old_wait = bo.LOCK_WAIT_MS
+            lock = None
+            try:
+                bo.LOCK_STRATEGY = "legacy-stale-file"
+                bo.LOCK_PATH = os.path.join(tmp, "lock.json")
+                bo.LOCK_WAIT_MS = 0
+                lock = bo.acquire_lock("run-1")
+                self.assertIsNotNone(lock)
+
+                # Simulate a run that started long ago but is still refreshing the lock.
+                with open(bo.LOCK_PATH, "w") as f:
+                    f.write('{"createdAtMs": 0}')
+                self.assertIsNone(bo.acquire_lock("run-2"))
+
+                # Without heartbeats the lock goes stale.
+                os.utime(bo.LOCK_PATH, (0, 0))
+                second = bo.acquire_lock("run-3")
+                self.assertIsNotNone(second)
+                bo.release_lock(second)
+            finally:
+                bo.release_lock(lock)
+                bo.LOCK_STRATEGY = old_strategy
+                bo.LOCK_PATH = old_path
+                bo.LOCK_WAIT_MS = old_wait
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,170 @@
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from scripts import board_orchestrator as bo
+
+
+class FakeKanboard:
+    def __init__(self, *, tasks: dict[int, dict], tags_by_task_id: dict[int, list[str]]):
+        self.pid = 1
+        self.tasks = {int(k): dict(v) for k, v in tasks.items()}
+        self.tags_by_task_id = {int(k): list(v) for k, v in tags_by_task_id.items()}
+
+        # Column ids
+        self.col_backlog = 10
+        self.col_ready = 11
+        self.col_wip = 12
+        self.col_review = 13
+        self.col_blocked = 14
+        self.col_done = 16
+
+        self.moves: list[tuple[int, int]] = []
+
+    def rpc(self, method, params=None):
+        if method == "getProjectByName":
+            return {"id": self.pid}
+        if method == "getBoard":
+            return [
+                {
+                    "id": 1,
+                    "name": "Default swimlane",
+                    "columns": [
+                        {"id": self.col_backlog, "title": "Backlog", "tasks": self._cards(self.col_backlog)},
+                        {"id": self.col_ready, "title": "Ready", "tasks": self._cards(self.col_ready)},
+                        {"id": self.col_wip, "title": "Work in progress", "tasks": self._cards(self.col_wip)},
+                        {"id": self.col_review, "title": "Review", "tasks": self._cards(self.col_review)},
+                        {"id": self.col_blocked, "title": "Blocked", "tasks": self._cards(self.col_blocked)},
+                        {"id": self.col_done, "title": "Done", "tasks": self._cards(self.col_done)},
+                    ],
+                }
+            ]
+        if method == "getTask":
+            task_id = int(params[0])
+            return dict(self.tasks[task_id])
+        if method == "getTaskTags":
+            task_id = int(params.get("task_id"))
+            tags = self.tags_by_task_id.get(task_id, [])
+            return {str(i + 1): t for i, t in enumerate(tags)}
+        if method == "setTaskTags":
+            _pid, task_id, tags = params
+            self.tags_by_task_id[int(task_id)] = list(tags)
+            return True
+        if method == "moveTaskPosition":
+            task_id = int(params["task_id"])
+            col_id = int(params["column_id"])
+            self.tasks[task_id]["column_id"] = col_id
+            self.moves.append((task_id, col_id))
+            return True
+        if method == "getMe":
+            return {"id": 1}
+        if method == "createComment":
+            return True
+        raise NotImplementedError(method)
+
+    def _cards(self, col_id: int) -> list[dict]:
+        cards: list[dict] = []
+        for t in self.tasks.values():
+            if int(t.get("column_id") or 0) != int(col_id):
+                continue
+            cards.append({"id": t["id"], "title": t["title"], "position": int(t.get("position") or 1)})
+        return sorted(cards, key=lambda c: int(c.get("position") or 10**9))
+
+
+class TestReadyQueue(unittest.TestCase):
+    def _run_exclusive_conflict(self, *, backlog: bool = False) -> tuple[FakeKanboard, dict]:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / "repo"
+            repo.mkdir()
+            log1 = Path(tmp) / "w1.log"
+            log1.write_text("still running\n")
+
+            wid = 301
+            rid = 302
+            tasks = {
+                wid: {
+                    "id": wid,
+                    "title": "WIP holding the db",
+                    "description": f"Repo: {repo}\n",
+                    "column_id": 12,
+                    "swimlane_id": 1,
+                    "position": 1,
+                },
+                rid: {
+                    "id": rid,
+                    "title": "Ready needing the db",
+                    "description": f"Repo: {repo}\n",
+                    "column_id": 11,
+                    "swimlane_id": 1,
+                    "position": 1,
+                },
+            }
+            if backlog:
+                tasks[303] = {
+                    "id": 303,
+                    "title": "Unrelated backlog work",
+                    "description": f"Repo: {repo}\n",
+                    "column_id": 10,
+                    "swimlane_id": 1,
+                    "position": 1,
+                }
+            fake = FakeKanboard(tasks=tasks, tags_by_task_id={wid: ["exclusive:db"], rid: ["exclusive:db"]})
+
+            state_path = Path(tmp) / "state.json"
+            state_path.write_text(
+                json.dumps(
+                    {
+                        "dryRun": False,
+                        "dryRunRunsRemaining": 0,
+                        "workersByTaskId": {
+                            str(wid): {"execSessionId": "opaque-worker", "logPath": str(log1)},
+                        },
+                    }
+                )
+            )
+
+            old_rpc = bo.rpc
+            old_state = bo.STATE_PATH
+            old_lock = bo.LOCK_PATH
+            old_spawn = bo.WORKER_SPAWN_CMD
+            old_leases = bo.WORKER_LEASES_ENABLED
+            try:
+                bo.rpc = fake.rpc  # type: ignore[assignment]
+                bo.STATE_PATH = str(state_path)
+                bo.LOCK_PATH = str(Path(tmp) / "lock.json")
+                bo.WORKER_SPAWN_CMD = "echo opaque-worker"
+                bo.WORKER_LEASES_ENABLED = False
+
+                buf = StringIO()
+                with redirect_stdout(buf):
+                    rc = bo.main()
+                self.assertEqual(rc, 0)
+            finally:
+                bo.rpc = old_rpc
+                bo.STATE_PATH = old_state
+                bo.LOCK_PATH = old_lock
+                bo.WORKER_SPAWN_CMD = old_spawn
+                bo.WORKER_LEASES_ENABLED = old_leases
+
+            return fake, json.loads(buf.getvalue().strip().splitlines()[-1])
+
+    def test_exclusive_conflict_is_reported_once_per_run(self) -> None:
+        fake, payload = self._run_exclusive_conflict()
+        conflicts = [a for a in payload["actions"] if "exclusive conflict" in a]
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(fake.tasks[302]["column_id"], fake.col_ready)
+
+    def test_conflicted_ready_card_blocks_backlog_promotion(self) -> None:
+        # #302 stays in Ready behind the exclusive conflict, so Ready is not empty and #303 must not be promoted.
+        fake, payload = self._run_exclusive_conflict(backlog=True)
+        self.assertEqual(fake.tasks[302]["column_id"], fake.col_ready)
+        self.assertEqual(fake.tasks[303]["column_id"], fake.col_backlog)
+        self.assertNotIn((303, fake.col_ready), fake.moves)
+        self.assertFalse([a for a in payload["actions"] if "Promoted Backlog #303" in a])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,6 +54,14 @@ class TestReviewResultParsing(unittest.TestCase):
         self.assertEqual(result.get("verdict"), "PASS")
         self.assertEqual(result.get("notes"), "ok")
 
+    def test_parse_review_result_embedded_json_with_braces_in_strings(self) -> None:
+        embedded = '{"score": 88, "verdict": "PASS", "notes": "handles } and { in text"}'
+        text = 'review_result: {"type": "result", "result": "' + embedded.replace('"', '\\"') + ' trailing"}'
+        result = bo.parse_review_result(text)
+        self.assertIsNotNone(result)
+        self.assertEqual(result.get("score"), 88)
+        self.assertEqual(result.get("notes"), "handles } and { in text")
+
     def test_parse_review_result_review_revision(self) -> None:
         text = 'review_result: {"score": 90, "verdict": "PASS", "review_revision": "abc123"}'
         result = bo.parse_review_result(text)
@@ -0,0 +1,126 @@
+import http.client
+import os
+import unittest
+import urllib.parse
+from unittest import mock
+
+from scripts import board_orchestrator as bo
+
+
+class TestRpcBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.old_post = bo._rpc_post
+        self.old_rpc = bo.rpc
+        self.posts: list = []
+        self.single: list = []
+
+    def tearDown(self) -> None:
+        bo._rpc_post = self.old_post
+        bo.rpc = self.old_rpc
+
+    def test_batch_results_follow_call_order(self) -> None:
+        def fake_post(payload, label):
+            self.posts.append(payload)
+            # Servers may answer out of order; results are matched by id.
+            return [{"jsonrpc": "2.0", "id": p["id"], "result": p["params"]["task_id"] * 10} for p in reversed(payload)]
+
+        bo._rpc_post = fake_post  # type: ignore[assignment]
+        res = bo.rpc_batch([("getTaskTags", {"task_id": 1}), ("getTaskTags", {"task_id": 2})])
+        self.assertEqual(res, [10, 20])
+        self.assertEqual(len(self.posts), 1)
+
+    def test_sub_error_raises(self) -> None:
+        def fake_post(payload, label):
+            return [
+                {"jsonrpc": "2.0", "id": 1, "result": True},
+                {"jsonrpc": "2.0", "id": 2, "error": {"code": -32601, "message": "Method not found"}},
+            ]
+
+        bo._rpc_post = fake_post  # type: ignore[assignment]
+        with self.assertRaises(RuntimeError):
+            bo.rpc_batch([("getMe", None), ("nope", None)])
+
+    def test_sub_error_returned_in_place_when_requested(self) -> None:
+        def fake_post(payload, label):
+            return [
+                {"jsonrpc": "2.0", "id": 1, "result": True},
+                {"jsonrpc": "2.0", "id": 2, "error": {"code": -32601, "message": "Method not found"}},
+            ]
+
+        bo._rpc_post = fake_post  # type: ignore[assignment]
+        res = bo.rpc_batch([("getMe", None), ("nope", None)], return_exceptions=True)
+        self.assertIs(res[0], True)
+        self.assertIsInstance(res[1], RuntimeError)
+
+    def test_falls_back_to_single_calls_when_batch_unsupported(self) -> None:
+        def fake_post(payload, label):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+
+        def fake_rpc(method, params=None):
+            self.single.append(method)
+            return method.upper()
+
+        bo._rpc_post = fake_post  # type: ignore[assignment]
+        bo.rpc = fake_rpc  # type: ignore[assignment]
+        self.assertEqual(bo.rpc_batch([("getMe", None), ("getVersion", None)]), ["GETME", "GETVERSION"])
+        self.assertEqual(self.single, ["getMe", "getVersion"])
+
+
+class FakeConn:
+    def __init__(self, fail: bool) -> None:
+        self.fail = fail
+        self.requests = 0
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests += 1
+        if self.fail:
+            raise http.client.RemoteDisconnected("closed")
+
+    def getresponse(self):
+        return mock.Mock(status=200, reason="OK", will_close=False, read=lambda: b'{"result": 1}')
+
+    def close(self):
+        pass
+
+
+class TestRpcPost(unittest.TestCase):
+    def setUp(self) -> None:
+        self.old_conn = bo._rpc_connection
+        self.old_creds = (bo.KANBOARD_USER, bo.KANBOARD_TOKEN)
+        bo.KANBOARD_USER, bo.KANBOARD_TOKEN = "u", "t"
+        self.stale = FakeConn(fail=True)
+        self.fresh = FakeConn(fail=False)
+        conns = iter([(self.stale, "/", True), (self.fresh, "/", False)])
+        bo._rpc_connection = lambda: next(conns)  # type: ignore[assignment]
+
+    def tearDown(self) -> None:
+        bo._rpc_connection = self.old_conn
+        bo.KANBOARD_USER, bo.KANBOARD_TOKEN = self.old_creds
+        bo.close_rpc_connection()
+
+    def test_read_is_retried_after_stale_keepalive(self) -> None:
+        self.assertEqual(bo._rpc_post({"method": "getTask", "id": 1}, "getTask"), {"result": 1})
+        self.assertEqual(self.fresh.requests, 1)
+
+    def test_write_is_not_resent_after_stale_keepalive(self) -> None:
+        with self.assertRaises(http.client.RemoteDisconnected):
+            bo._rpc_post({"method": "createTask", "id": 1}, "createTask")
+        self.assertEqual(self.fresh.requests, 0)
+
+
+class TestRpcProxy(unittest.TestCase):
+    def test_proxy_env_is_honored_unless_bypassed(self) -> None:
+        url = urllib.parse.urlsplit("http://kanboard.example:8080/jsonrpc.php")
+        env = {"http_proxy": "http://user:pw@proxy.example:3128", "no_proxy": ""}
+        with mock.patch.dict(os.environ, env, clear=True):
+            proxy = bo._rpc_proxy_for(url)
+        self.assertIsNotNone(proxy)
+        self.assertEqual((proxy.hostname, proxy.port, proxy.username), ("proxy.example", 3128, "user"))
+
+        env["no_proxy"] = "kanboard.example"
+        with mock.patch.dict(os.environ, env, clear=True):
+            self.assertIsNone(bo._rpc_proxy_for(url))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts import board_orchestrator as bo
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: list = []
+    drop_idle = False
+
+    def setup(self) -> None:
+        super().setup()
+        _Handler.connections.append(self.client_address)
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        length = int(self.headers.get("Content-Length") or 0)
+        req = json.loads(self.rfile.read(length))
+        body = json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": req["method"]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close without announcing it, like a server timing out an idle keep-alive socket.
+        self.close_connection = _Handler.drop_idle
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestRpcKeepAlive(unittest.TestCase):
+    def setUp(self) -> None:
+        _Handler.connections = []
+        _Handler.drop_idle = False
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.old = (bo.KANBOARD_BASE, bo.KANBOARD_USER, bo.KANBOARD_TOKEN)
+        bo.KANBOARD_BASE = f"http://127.0.0.1:{self.server.server_address[1]}/jsonrpc.php"
+        bo.KANBOARD_USER = "jsonrpc"
+        bo.KANBOARD_TOKEN = "token"
+        bo.close_rpc_connection()
+
+    def tearDown(self) -> None:
+        bo.close_rpc_connection()
+        bo.KANBOARD_BASE, bo.KANBOARD_USER, bo.KANBOARD_TOKEN = self.old
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_calls_share_one_connection(self) -> None:
+        self.assertEqual(bo.rpc("getMe"), "getMe")
+        self.assertEqual(bo.rpc("getVersion"), "getVersion")
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_reconnects_after_server_drops_idle_connection(self) -> None:
+        _Handler.drop_idle = True
+        self.assertEqual(bo.rpc("getMe"), "getMe")
+        self.assertEqual(bo.rpc("getVersion"), "getVersion")
+        self.assertEqual(len(_Handler.connections), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
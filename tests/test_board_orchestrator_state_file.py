@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts import board_orchestrator as bo
+
+
+class TestStateFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self._old_state = bo.STATE_PATH
+        self._old_pretty = bo.PRETTY_STATE
+        self._tmp = tempfile.TemporaryDirectory()
+        bo.STATE_PATH = str(Path(self._tmp.name) / "state" / "state.json")
+
+    def tearDown(self) -> None:
+        bo.STATE_PATH = self._old_state
+        bo.PRETTY_STATE = self._old_pretty
+        self._tmp.cleanup()
+
+    def test_save_state_round_trips_and_leaves_no_temp_file(self) -> None:
+        bo.PRETTY_STATE = False
+        bo.save_state({"b": 1, "a": {"7": 2}})
+
+        self.assertEqual(bo.load_state(), {"b": 1, "a": {"7": 2}})
+        self.assertEqual(os.listdir(os.path.dirname(bo.STATE_PATH)), ["state.json"])
+        self.assertNotIn("\n", Path(bo.STATE_PATH).read_text(encoding="utf-8").strip())
+
+    def test_pretty_state_is_indented(self) -> None:
+        bo.PRETTY_STATE = True
+        bo.save_state({"b": 1, "a": 2})
+
+        raw = Path(bo.STATE_PATH).read_text(encoding="utf-8")
+        self.assertIn("\n", raw)
+        self.assertEqual(json.loads(raw), {"a": 2, "b": 1})
+
+    def test_unchanged_state_is_not_rewritten(self) -> None:
+        bo.save_state({"a": 1})
+        before = os.stat(bo.STATE_PATH).st_ino
+
+        bo.save_state({"a": 1})
+        self.assertEqual(os.stat(bo.STATE_PATH).st_ino, before)
+
+        bo.save_state({"a": 2})
+        self.assertEqual(bo.load_state(), {"a": 2})
+
+    def test_failed_write_keeps_previous_state(self) -> None:
+        bo.save_state({"ok": True})
+        with self.assertRaises(Exception):
+            bo.save_state({"bad": object()})
+
+        self.assertEqual(bo.load_state(), {"ok": True})
+        self.assertEqual(os.listdir(os.path.dirname(bo.STATE_PATH)), ["state.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+
+from scripts import board_orchestrator as bo
+
+
+class FakeRpc:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.tags = {1: ["story"], 2: []}
+        self.column = {1: 10, 2: 10}
+        self.failing: set[int] = set()
+        self.missing_tags: set[int] = set()
+
+    def __call__(self, method, params=None):
+        self.calls.append(method)
+        if method == "getTaskTags":
+            tid = int(params["task_id"])
+            if tid in self.missing_tags:
+                raise RuntimeError("getTaskTags failed")
+            return {str(i + 1): t for i, t in enumerate(self.tags[tid])}
+        if method == "getTask":
+            tid = int(params[0])
+            return {"id": tid, "column_id": self.column[tid]}
+        if method == "setTaskTags":
+            _pid, tid, tags = params
+            if int(tid) in self.failing:
+                raise RuntimeError("setTaskTags failed")
+            self.tags[int(tid)] = list(tags)
+            return True
+        if method == "moveTaskPosition":
+            self.column[int(params["task_id"])] = int(params["column_id"])
+            return True
+        raise NotImplementedError(method)
+
+
+class TestTaskCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.old_rpc = bo.rpc
+        self.fake = FakeRpc()
+        bo.rpc = self.fake  # type: ignore[assignment]
+        bo.reset_task_caches()
+
+    def tearDown(self) -> None:
+        bo.rpc = self.old_rpc
+        bo.reset_task_caches()
+
+    def test_tags_are_fetched_once_and_written_through(self) -> None:
+        self.assertEqual(bo.get_task_tags(1), ["story"])
+        self.assertEqual(bo.get_task_tags(1), ["story"])
+        self.assertEqual(self.fake.calls.count("getTaskTags"), 1)
+
+        bo.set_task_tags(1, 1, ["story", "hold"])
+        self.assertEqual(bo.get_task_tags(1), ["story", "hold"])
+        self.assertEqual(self.fake.calls.count("getTaskTags"), 1)
+
+    def test_returned_tags_do_not_alias_the_cache(self) -> None:
+        tags = bo.get_task_tags(1)
+        tags.append("mutated")
+        self.assertEqual(bo.get_task_tags(1), ["story"])
+
+    def test_move_invalidates_cached_task(self) -> None:
+        self.assertEqual(bo.get_task(2)["column_id"], 10)
+        bo.move_task(1, 2, 16, 1, 1)
+        self.assertEqual(bo.get_task(2)["column_id"], 16)
+        self.assertEqual(self.fake.calls.count("getTask"), 2)
+
+    def test_task_description_prefers_board_payload(self) -> None:
+        self.assertEqual(bo.task_description({"id": 1, "description": "Depends on: #2"}), "Depends on: #2")
+        self.assertEqual(self.fake.calls.count("getTask"), 0)
+
+        self.assertEqual(bo.task_description({"id": 1}), "")
+        self.assertEqual(self.fake.calls.count("getTask"), 1)
+
+    def test_prefetch_seeds_tag_cache(self) -> None:
+        bo.prefetch_task_tags([1, 2, 1])
+        fetched = self.fake.calls.count("getTaskTags")
+        self.assertEqual(bo.get_task_tags(2), [])
+        self.assertEqual(bo.get_task_tags(1), ["story"])
+        self.assertEqual(self.fake.calls.count("getTaskTags"), fetched)
+
+    def test_prefetch_task_details_seeds_both_caches(self) -> None:
+        bo.prefetch_task_details([2], [1, 2])
+        calls = len(self.fake.calls)
+        self.assertEqual(bo.get_task(2)["column_id"], 10)
+        self.assertEqual(bo.get_task_tags(1), ["story"])
+        self.assertEqual(bo.get_task_tags(2), [])
+        self.assertEqual(len(self.fake.calls), calls)
+
+    def test_prefetch_caches_successes_when_one_call_fails(self) -> None:
+        self.fake.missing_tags.add(1)
+        bo.prefetch_task_details([2], [1, 2])
+        calls = len(self.fake.calls)
+        self.assertEqual(bo.get_task(2)["column_id"], 10)
+        self.assertEqual(bo.get_task_tags(2), [])
+        self.assertEqual(len(self.fake.calls), calls)
+
+        # The failed entry is left uncached and fetched on demand.
+        self.fake.missing_tags.clear()
+        self.assertEqual(bo.get_task_tags(1), ["story"])
+        self.assertEqual(len(self.fake.calls), calls + 1)
+
+    def test_queued_tag_changes_flush_once(self) -> None:
+        tags = bo.get_task_tags(1)
+        bo.queue_task_tags(1, tags + ["hold"])
+        bo.queue_task_tags(1, bo.get_task_tags(1) + ["paused"])
+        self.assertEqual(bo.get_task_tags(1), ["story", "hold", "paused"])
+        self.assertEqual(self.fake.calls.count("setTaskTags"), 0)
+
+        self.assertEqual(bo.flush_task_tags(1), [])
+        self.assertEqual(self.fake.calls.count("setTaskTags"), 1)
+        self.assertEqual(self.fake.tags[1], ["story", "hold", "paused"])
+
+        bo.flush_task_tags(1)
+        self.assertEqual(self.fake.calls.count("setTaskTags"), 1)
+
+    def test_queued_changes_that_cancel_out_are_not_written(self) -> None:
+        tags = bo.get_task_tags(1)
+        bo.queue_task_tags(1, tags + ["hold"])
+        bo.queue_task_tags(1, tags)
+        bo.flush_task_tags(1)
+        self.assertEqual(self.fake.calls.count("setTaskTags"), 0)
+
+    def test_failed_tag_write_is_reported_and_others_still_land(self) -> None:
+        self.fake.failing.add(1)
+        bo.queue_task_tags(1, bo.get_task_tags(1) + ["hold"])
+        bo.queue_task_tags(2, bo.get_task_tags(2) + ["paused"])
+
+        errors = bo.flush_task_tags(1)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("#1", errors[0])
+        self.assertEqual(self.fake.tags[2], ["paused"])
+        # Each write is sent once; a failure doesn't resend the writes that landed.
+        self.assertEqual(self.fake.calls.count("setTaskTags"), 2)
+        # The cache no longer claims a write that never happened.
+        self.assertEqual(bo.get_task_tags(1), ["story"])
+
+    def test_flush_keeps_tags_changed_on_the_board_during_the_run(self) -> None:
+        bo.queue_task_tags(1, bo.get_task_tags(1) + ["paused"])
+        # Someone adds hold and drops story while the run is still going.
+        self.fake.tags[1] = ["hold"]
+
+        self.assertEqual(bo.flush_task_tags(1), [])
+        self.assertEqual(self.fake.tags[1], ["hold", "paused"])
+        self.assertEqual(bo.get_task_tags(1), ["hold", "paused"])
+
+
+if __name__ == "__main__":
+    unittest.main()
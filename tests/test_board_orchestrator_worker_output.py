@@ -31,6 +31,66 @@ class TestWorkerOutputDetection(unittest.TestCase):
 
             self.assertIsNone(result)
 
+    def test_read_tail_returns_last_bytes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "task-30.log"
+            log_path.write_bytes(b"0123456789")
+
+            self.assertEqual(bo.read_tail_bytes(str(log_path), 4), b"6789")
+            self.assertEqual(bo.read_tail(str(log_path), 0), "0123456789")
+            self.assertEqual(bo.read_tail(str(Path(tmp) / "missing.log"), 4), "")
+
+
+class TestSpawnArgv(unittest.TestCase):
+    def test_simple_template_is_split_and_formatted_unquoted(self) -> None:
+        argv = bo.format_spawn_argv(
+            "spawn.sh --task {task_id} --repo '{repo_path}'", task_id=7, repo_path="/tmp/My Repo"
+        )
+        self.assertEqual(argv, ["spawn.sh", "--task", "7", "--repo", "/tmp/My Repo"])
+
+    def test_shell_syntax_falls_back_to_shell(self) -> None:
+        self.assertIsNone(bo.format_spawn_argv("spawn.sh {task_id} | tee log", task_id=7))
+        self.assertIsNone(bo.format_spawn_argv("FOO=1 spawn.sh {task_id}", task_id=7))
+        self.assertIsNone(bo.format_spawn_argv("spawn.sh $HOME", task_id=7))
+
+    def test_spawn_worker_without_repo_path_passes_empty_path(self) -> None:
+        # Tasks opted out of repo mapping still spawn; the script just gets an empty repo path.
+        old_cmd = bo.WORKER_SPAWN_CMD
+        old_run = bo.subprocess.run
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append((args, kwargs.get("shell")))
+            return bo.subprocess.CompletedProcess(args, 0, stdout="opaque-worker\n")
+
+        try:
+            bo.WORKER_SPAWN_CMD = "spawn.sh {task_id} {repo_path}"
+            bo.subprocess.run = fake_run  # type: ignore[assignment]
+            self.assertIsNotNone(bo.spawn_worker(7, None, None))
+            self.assertEqual(calls, [(["spawn.sh", "7", ""], False)])
+        finally:
+            bo.WORKER_SPAWN_CMD = old_cmd
+            bo.subprocess.run = old_run
+
+    def test_spawn_reviewer_execs_simple_template_without_shell(self) -> None:
+        old_cmd = bo.REVIEWER_SPAWN_CMD
+        old_run = bo.subprocess.run
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append((args, kwargs.get("shell")))
+            return bo.subprocess.CompletedProcess(args, 0, stdout="tmux:review:7\n")
+
+        try:
+            bo.REVIEWER_SPAWN_CMD = "review.sh {task_id} {patch_path}"
+            bo.subprocess.run = fake_run  # type: ignore[assignment]
+            entry = bo.spawn_reviewer(7, "server", "/tmp/repo", "/tmp/My Patch.diff", None)
+            self.assertEqual(calls, [(["review.sh", "7", "/tmp/My Patch.diff"], False)])
+            self.assertEqual(entry["execSessionId"], "tmux:review:7")
+        finally:
+            bo.REVIEWER_SPAWN_CMD = old_cmd
+            bo.subprocess.run = old_run
+
 
 if __name__ == "__main__":
     unittest.main()
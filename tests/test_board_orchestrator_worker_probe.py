@@ -0,0 +1,32 @@
+import threading
+import unittest
+
+from scripts import board_orchestrator as bo
+
+
+class TestProbeWorkersAlive(unittest.TestCase):
+    def test_dedupes_handles_and_maps_results(self) -> None:
+        calls = []
+        lock = threading.Lock()
+
+        def fake_alive(handle):
+            with lock:
+                calls.append(handle)
+            return handle != "tmux:s:dead"
+
+        orig = bo.worker_is_alive
+        bo.worker_is_alive = fake_alive
+        try:
+            out = bo.probe_workers_alive(["tmux:s:a", "tmux:s:dead", "tmux:s:a", "", "pid:1"])
+        finally:
+            bo.worker_is_alive = orig
+
+        self.assertEqual(out, {"tmux:s:a": True, "tmux:s:dead": False, "pid:1": True})
+        self.assertEqual(sorted(calls), ["pid:1", "tmux:s:a", "tmux:s:dead"])
+
+    def test_empty_input(self) -> None:
+        self.assertEqual(bo.probe_workers_alive([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()